@@ -0,0 +1,356 @@
+"""Load test: many concurrent visitor sessions against one Streamlit server.
+
+    python -m benchmarks.load                           # start a server, 1, 5, 10 and 25 visitors
+    python -m benchmarks.load --sessions 50 --duration 120
+    python -m benchmarks.load --url http://localhost:8501 --server-pid 1234
+
+Each simulated visitor speaks the browser's websocket protocol (BackMsg and
+ForwardMsg protobufs on /_stcore/stream) and repeats a journey: land on
+main.py, follow the page links to the dashboard, projects and about pages,
+open the chatbot and send a few messages, pausing between steps like a
+reader would. Every journey opens a new session, so session setup and
+per-session memory are part of the load.
+
+A rerun's latency is the time from sending the request to the server's
+script_finished message. For every concurrency level in ``--sessions`` this
+reports throughput, p50/p95/p99 latency overall and per step, errors, and
+the server process's CPU use and resident memory (from /proc, so on Linux).
+
+Without ``--url`` the server is started here with the chatbot on the local
+stub provider and chat rate limits lifted, so only our own code is measured
+and nothing touches the network.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.asyncio.client import connect
+
+ROOT = Path(__file__).parent.parent.absolute()
+
+# Pages visited after landing, by the file name of their script
+TOUR = ("dashboard", "projects", "about_me")
+CHAT_PAGE = "chatbot"
+QUESTIONS = (
+    "Hello!",
+    "What projects has Hafsa built?",
+    "Which skills does she use most?",
+    "Tell me about the Library Management System.",
+    "What is she working on now?",
+)
+
+SERVER_ENV = {
+    "PORTFOLIO_ASSET_WATCH": "0",
+    "CHATBOT_BACKEND": "local",
+    "CHATBOT_SESSION_BURST": "1000",
+    "CHATBOT_GLOBAL_RATE": "100000",
+    "CHATBOT_GLOBAL_BURST": "100000",
+}
+
+STEP_TIMEOUT = 60
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+class RerunError(Exception):
+    pass
+
+
+class StepFailed(Exception):
+    """A journey step failed; already counted in the stage's errors."""
+
+
+class Visitor:
+    """One browser tab: a websocket session and the state needed to navigate it."""
+
+    def __init__(self, url):
+        self.url = url
+        self.ws = None
+        self.pages = {}
+        self.chat_input_id = None
+
+    async def __aenter__(self):
+        self.ws = await connect(
+            self.url.replace("http", "ws", 1) + "/_stcore/stream",
+            subprotocols=["streamlit"],
+            max_size=None,
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.ws.close()
+
+    async def rerun(self, page_script_hash="", widget_states=()):
+        """Request a script run and wait for it to finish; returns (seconds, bytes received)."""
+        msg = BackMsg()
+        client_state = msg.rerun_script
+        client_state.page_script_hash = page_script_hash
+        client_state.widget_states.widgets.extend(widget_states)
+        started = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        received = 0
+        while True:
+            data = await asyncio.wait_for(self.ws.recv(), STEP_TIMEOUT)
+            received += len(data)
+            fwd = ForwardMsg()
+            fwd.ParseFromString(data)
+            kind = fwd.WhichOneof("type")
+            if kind in ("new_session", "navigation"):
+                app_pages = getattr(fwd, kind).app_pages
+                self.pages.update({p.url_pathname: p.page_script_hash for p in app_pages if p.url_pathname})
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                if element.WhichOneof("type") == "exception":
+                    raise RerunError(element.exception.message)
+                if element.WhichOneof("type") == "chat_input":
+                    self.chat_input_id = element.chat_input.id
+            elif kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                if fwd.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise RerunError("compile error")
+                return time.perf_counter() - started, received
+
+    async def open_page(self, name):
+        return await self.rerun(self.pages[name])
+
+    async def chat(self, text):
+        if self.chat_input_id is None:
+            raise RerunError("no chat input on the page")
+        state = WidgetState(id=self.chat_input_id)
+        state.chat_input_value.data = text
+        return await self.rerun(self.pages[CHAT_PAGE], [state])
+
+
+class Stats:
+    """Rerun latencies per step, plus errors, for one concurrency level."""
+
+    def __init__(self):
+        self.latencies = {}
+        self.bytes = 0
+        self.errors = {}
+        self.journeys = 0
+
+    def add(self, step, seconds, received):
+        self.latencies.setdefault(step, []).append(seconds)
+        self.bytes += received
+
+    def error(self, step, e):
+        key = f"{step}: {type(e).__name__}"
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+    @property
+    def reruns(self) -> int:
+        return sum(len(values) for values in self.latencies.values())
+
+
+def percentiles(values) -> dict:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def at(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 1)
+
+    return {"p50": at(0.50), "p95": at(0.95), "p99": at(0.99), "max": round(ordered[-1] * 1000, 1)}
+
+
+async def journey(url, stats, rng, chat_turns, think):
+    """Land, tour the content pages, then chat; one fresh session."""
+    async def step(name, action):
+        try:
+            seconds, received = await action
+        except Exception as e:
+            stats.error(name, e)
+            raise StepFailed(name) from e
+        stats.add(name, seconds, received)
+        await asyncio.sleep(rng.uniform(*think))
+
+    async with Visitor(url) as visitor:
+        await step("main", visitor.rerun())
+        for page in TOUR:
+            await step(page, visitor.open_page(page))
+        await step(CHAT_PAGE, visitor.open_page(CHAT_PAGE))
+        for _ in range(chat_turns):
+            await step("chat", visitor.chat(rng.choice(QUESTIONS)))
+    stats.journeys += 1
+
+
+async def visitor_loop(url, stats, deadline, seed, chat_turns, think):
+    rng = random.Random(seed)
+    while time.monotonic() < deadline:
+        try:
+            await journey(url, stats, rng, chat_turns, think)
+        except Exception as e:
+            # A failed step was recorded by journey(); anything else is the connection
+            if not isinstance(e, StepFailed):
+                stats.error("connect", e)
+            # Back off so a failing server is not hammered in a tight loop
+            await asyncio.sleep(1)
+
+
+class ProcessSampler:
+    """Samples a process's CPU time and resident memory from /proc."""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.rss = []
+        self._cpu_start = self._wall_start = None
+
+    def _cpu_seconds(self):
+        with open(f"/proc/{self.pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        # utime and stime are fields 14 and 15 of the full line
+        return (int(fields[11]) + int(fields[12])) / CLK_TCK
+
+    def _rss_mb(self):
+        with open(f"/proc/{self.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+        return None
+
+    @property
+    def available(self) -> bool:
+        return self.pid is not None and os.path.exists(f"/proc/{self.pid}/stat")
+
+    async def run(self, interval=0.5):
+        if not self.available:
+            return
+        self._cpu_start, self._wall_start = self._cpu_seconds(), time.monotonic()
+        while True:
+            self.rss.append(self._rss_mb())
+            await asyncio.sleep(interval)
+
+    def summary(self) -> dict:
+        if not self.available or self._cpu_start is None:
+            return {}
+        elapsed = time.monotonic() - self._wall_start
+        return {
+            "cpu_percent": round(100 * (self._cpu_seconds() - self._cpu_start) / elapsed, 1),
+            "rss_start_mb": round(self.rss[0], 1),
+            "rss_peak_mb": round(max(self.rss), 1),
+            "rss_end_mb": round(self._rss_mb(), 1),
+        }
+
+
+async def run_stage(url, sessions, duration, ramp, chat_turns, think, server_pid) -> dict:
+    """Run ``sessions`` concurrent visitors for ``duration`` seconds."""
+    stats = Stats()
+    sampler = ProcessSampler(server_pid)
+    sampling = asyncio.create_task(sampler.run())
+    started = time.monotonic()
+    deadline = started + duration
+
+    async def delayed(i):
+        # Spread session starts over the ramp-up period
+        await asyncio.sleep(ramp * i / sessions)
+        await visitor_loop(url, stats, deadline, i, chat_turns, think)
+
+    await asyncio.gather(*(delayed(i) for i in range(sessions)))
+    elapsed = time.monotonic() - started
+    server = sampler.summary()
+    sampling.cancel()
+
+    everything = [v for values in stats.latencies.values() for v in values]
+    return {
+        "sessions": sessions,
+        "seconds": round(elapsed, 1),
+        "journeys": stats.journeys,
+        "reruns": stats.reruns,
+        "reruns_per_second": round(stats.reruns / elapsed, 2),
+        "kb_per_rerun": round(stats.bytes / 1024 / stats.reruns, 1) if stats.reruns else None,
+        "latency_ms": percentiles(everything),
+        "steps": {step: percentiles(values) for step, values in stats.latencies.items()},
+        "errors": stats.errors,
+        "server": server,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, script="main.py", timeout=60):
+    """Start ``streamlit run`` with SERVER_ENV and wait until it is healthy."""
+    env = dict(os.environ, **SERVER_ENV)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script,
+         "--server.headless", "true", "--server.port", str(port),
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"streamlit exited with status {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError("streamlit did not become healthy in time")
+
+
+def _print_stage(result):
+    latency = result["latency_ms"]
+    server = result["server"]
+    print(
+        f"{result['sessions']:>4} sessions  {result['reruns_per_second']:>7} reruns/s  "
+        f"p50 {latency.get('p50', '-'):>7}  p95 {latency.get('p95', '-'):>7}  p99 {latency.get('p99', '-'):>7} ms  "
+        + (f"cpu {server['cpu_percent']:>5}%  rss {server['rss_peak_mb']:>6} MB" if server else "")
+    )
+    for step, values in result["steps"].items():
+        print(f"      {step:<10} p50 {values['p50']:>7}  p95 {values['p95']:>7}  p99 {values['p99']:>7} ms")
+    for error, count in result["errors"].items():
+        print(f"      error {error} x{count}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="running app to test (default: start one)")
+    parser.add_argument("--server-pid", type=int, help="PID of the --url server, for CPU and memory")
+    parser.add_argument("--sessions", default="1,5,10,25", help="comma-separated concurrency levels")
+    parser.add_argument("--duration", type=float, default=30, help="seconds per level (default: 30)")
+    parser.add_argument("--ramp", type=float, default=5, help="seconds over which sessions start")
+    parser.add_argument("--chat-turns", type=int, default=3, help="messages per visit to the chatbot")
+    parser.add_argument("--think", type=float, nargs=2, default=(0.5, 2.0), metavar=("MIN", "MAX"),
+                        help="seconds a visitor pauses between steps (default: 0.5 2.0)")
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    args = parser.parse_args()
+
+    server = None
+    url, pid = args.url, args.server_pid
+    if url is None:
+        port = _free_port()
+        server = start_server(port)
+        url, pid = f"http://127.0.0.1:{port}", server.pid
+    url = url.rstrip("/")
+
+    results = []
+    try:
+        for sessions in (int(n) for n in args.sessions.split(",")):
+            result = asyncio.run(run_stage(
+                url, sessions, args.duration, args.ramp, args.chat_turns, tuple(args.think), pid
+            ))
+            _print_stage(result)
+            results.append(result)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    if args.json:
+        args.json.write_text(json.dumps({"url": url, "stages": results}, indent=2) + "\n")
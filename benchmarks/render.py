@@ -0,0 +1,234 @@
+"""Page-render benchmarks, run headlessly with Streamlit's AppTest harness.
+
+    python -m benchmarks.render                  # run and compare with benchmarks/baseline.json
+    python -m benchmarks.render --update         # run and write the baseline
+    python -m benchmarks.render --page chatbot --turns 20
+
+Every page script runs in a fresh interpreter, so the first run is cold:
+content, stylesheets, image markup and figures are built on demand (the
+background warm-up is switched off). For each page this records
+
+    cold_ms         wall time of the first run, including module execution
+    warm_ms         median wall time of ``--repeat`` reruns in the same session
+    payload_bytes   bytes of ForwardMsg payload a warm rerun sends (core.perf)
+    alloc_peak_kb   peak Python allocations during one warm rerun (tracemalloc)
+    rss_peak_mb     peak resident memory of the interpreter
+
+The chatbot then holds a ``--turns`` conversation with the local stub
+provider, with no upstream latency and no response cache, which adds
+turn_ms (median), turn_bytes (median) and history_bytes: the payload of a
+plain rerun once the whole conversation is on screen.
+
+Nothing here touches the network. A metric regresses when it exceeds its
+baseline value times the threshold ratio plus the absolute slack stored
+with the baseline; any regression makes the command exit with status 1.
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent.absolute()
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+SCRIPTS = {
+    "main": "main.py",
+    "dashboard": "pages/dashboard.py",
+    "projects": "pages/projects.py",
+    "about": "pages/about_me.py",
+    "chatbot": "pages/chatbot.py",
+}
+
+# Questions cycled through during the chatbot conversation
+QUESTIONS = (
+    "Hello!",
+    "What projects has Hafsa built?",
+    "Which skills does she use most?",
+    "Tell me more about the Face Emotion Detector project.",
+    "What would you build next with those skills?",
+)
+
+# Settings every measured interpreter runs with: no background threads that
+# compete with the page, an instant stub model, no caching or rate limiting
+# of chat turns, and the perf log on so payload bytes can be read back.
+BENCH_ENV = {
+    "PORTFOLIO_WARMUP": "0",
+    "PORTFOLIO_ASSET_WATCH": "0",
+    "PORTFOLIO_BACKGROUND_MODE": "first",
+    "PORTFOLIO_PERF": "1",
+    "PORTFOLIO_PERF_PANEL": "0",
+    "CHATBOT_BACKEND": "local",
+    "CHATBOT_LOCAL_LATENCY": "0",
+    "CHATBOT_LOCAL_TOKENS_PER_SEC": "1000000",
+    "CHATBOT_CACHE_BACKEND": "none",
+    "CHATBOT_SESSION_BURST": "1000",
+    "CHATBOT_GLOBAL_BURST": "1000",
+}
+
+# Regression if value > baseline * ratio + slack. Timings are noisy on shared
+# machines, so they only catch large slowdowns; payload sizes are exact.
+DEFAULT_THRESHOLDS = {
+    "cold_ms": {"ratio": 2.0, "slack": 100},
+    "warm_ms": {"ratio": 2.0, "slack": 15},
+    "turn_ms": {"ratio": 2.0, "slack": 15},
+    "payload_bytes": {"ratio": 1.05, "slack": 256},
+    "turn_bytes": {"ratio": 1.05, "slack": 256},
+    "history_bytes": {"ratio": 1.05, "slack": 256},
+    "alloc_peak_kb": {"ratio": 1.5, "slack": 64},
+    "rss_peak_mb": {"ratio": 1.25, "slack": 10},
+}
+
+TIMEOUT = 120
+
+
+class _PerfRecords(logging.Handler):
+    """Collects the JSON records core.perf logs for each page run."""
+
+    def __init__(self):
+        super().__init__(logging.INFO)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(json.loads(record.getMessage()))
+
+    def last_bytes(self) -> int:
+        return self.records[-1]["bytes"] if self.records else 0
+
+
+def _timed(run):
+    started = time.perf_counter()
+    at = run()
+    elapsed = (time.perf_counter() - started) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def _peak_rss_mb() -> float:
+    import resource
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def measure(page, repeat=5, turns=10) -> dict:
+    """Benchmark one page in this interpreter; the first run is only cold in a fresh one."""
+    from streamlit.testing.v1 import AppTest
+
+    perf_log = _PerfRecords()
+    logger = logging.getLogger("portfolio.perf")
+    logger.addHandler(perf_log)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    at = AppTest.from_file(str(ROOT / SCRIPTS[page]), default_timeout=TIMEOUT)
+    result = {"cold_ms": round(_timed(at.run), 2)}
+
+    warm = [_timed(at.run) for _ in range(repeat)]
+    result["warm_ms"] = round(statistics.median(warm), 2)
+    result["payload_bytes"] = perf_log.last_bytes()
+
+    tracemalloc.start()
+    _timed(at.run)
+    result["alloc_peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    tracemalloc.stop()
+
+    if page == "chatbot" and turns:
+        turn_ms, turn_bytes = [], []
+        for i in range(turns):
+            turn_ms.append(_timed(at.chat_input[0].set_value(QUESTIONS[i % len(QUESTIONS)]).run))
+            turn_bytes.append(perf_log.last_bytes())
+        result["turns"] = turns
+        result["turn_ms"] = round(statistics.median(turn_ms), 2)
+        result["turn_bytes"] = int(statistics.median(turn_bytes))
+        _timed(at.run)
+        result["history_bytes"] = perf_log.last_bytes()
+
+    result["rss_peak_mb"] = round(_peak_rss_mb(), 1)
+    return result
+
+
+def run_isolated(page, repeat, turns) -> dict:
+    """Run ``measure`` for ``page`` in a fresh interpreter with BENCH_ENV."""
+    env = dict(os.environ, **BENCH_ENV)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.render", "--measure", page,
+         "--repeat", str(repeat), "--turns", str(turns)],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=TIMEOUT * (repeat + turns + 3),
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{page} failed:\n{completed.stderr.strip()}")
+    # The result is the last line; Streamlit may log above it
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline) -> list:
+    """(page, metric, value, limit) for every metric over its baseline threshold."""
+    thresholds = baseline.get("thresholds", {})
+    regressions = []
+    for page, metrics in results.items():
+        expected = baseline.get("pages", {}).get(page, {})
+        for metric, value in metrics.items():
+            if metric not in DEFAULT_THRESHOLDS or metric not in expected:
+                continue
+            threshold = thresholds.get(metric, DEFAULT_THRESHOLDS[metric])
+            limit = expected[metric] * threshold["ratio"] + threshold["slack"]
+            if value > limit:
+                regressions.append((page, metric, value, round(limit, 2)))
+    return regressions
+
+
+def _print_table(results, baseline):
+    expected = baseline.get("pages", {}) if baseline else {}
+    for page, metrics in results.items():
+        print(page)
+        for metric, value in metrics.items():
+            before = expected.get(page, {}).get(metric)
+            change = f"  ({(value - before) / before:+.0%} vs baseline)" if before else ""
+            print(f"  {metric:<15} {value:>12}{change}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page", action="append", choices=SCRIPTS, help="page to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="warm reruns per page (default: 5)")
+    parser.add_argument("--turns", type=int, default=10, help="chatbot conversation length (default: 10)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--measure", choices=SCRIPTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.repeat, args.turns)))
+        raise SystemExit(0)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    results = {page: run_isolated(page, args.repeat, args.turns) for page in args.page or SCRIPTS}
+    _print_table(results, baseline)
+
+    if args.update:
+        pages = dict(baseline["pages"]) if baseline else {}
+        pages.update(results)
+        thresholds = baseline["thresholds"] if baseline else DEFAULT_THRESHOLDS
+        document = {
+            "version": 1,
+            "python": sys.version.split()[0],
+            "repeat": args.repeat,
+            "turns": args.turns,
+            "thresholds": thresholds,
+            "pages": pages,
+        }
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Wrote {args.baseline}")
+    elif baseline:
+        regressions = compare(results, baseline)
+        for page, metric, value, limit in regressions:
+            print(f"REGRESSION {page}.{metric}: {value} > {limit}")
+        raise SystemExit(1 if regressions else 0)
@@ -0,0 +1 @@
+"""Shared helpers used by main.py and the scripts in pages/."""
@@ -0,0 +1,47 @@
+"""Tiny static file server for the hash-versioned files in static/.
+
+Streamlit's own app/static route revalidates on every request. Since published
+file names change whenever the content does, they can be cached forever:
+
+    python -m core.asset_server --port 8502
+    PORTFOLIO_ASSET_BASE_URL=http://localhost:8502 streamlit run main.py
+"""
+import argparse
+import functools
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from core.static import STATIC_DIR
+
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImmutableAssetHandler(SimpleHTTPRequestHandler):
+    def end_headers(self):
+        self.send_header("Cache-Control", CACHE_CONTROL)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        super().end_headers()
+
+    def list_directory(self, path):
+        self.send_error(404, "Not found")
+        return None
+
+
+def serve(host="127.0.0.1", port=8502):
+    STATIC_DIR.mkdir(exist_ok=True)
+    handler = functools.partial(ImmutableAssetHandler, directory=str(STATIC_DIR))
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Serving {STATIC_DIR} at http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args()
+    serve(args.host, args.port)
@@ -0,0 +1,90 @@
+import base64
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+# Default budget for cached asset bytes (raw + base64) shared by every session
+DEFAULT_BUDGET_BYTES = int(os.getenv("PORTFOLIO_ASSET_CACHE_BYTES", 64 * 1024 * 1024))
+
+
+class AssetCache:
+    """Process-wide LRU cache of asset files, keyed by path + mtime + size.
+
+    Entries are invalidated automatically when a file changes on disk because
+    the stat signature becomes part of the key. The cache holds at most
+    ``budget_bytes`` of data; least recently used entries are dropped first.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, path: Path):
+        stat = path.stat()
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    def _get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return value
+
+    def _put(self, key, value):
+        size = len(value)
+        if size > self.budget_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = value
+            self._size += size
+            while self._size > self.budget_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def read_bytes(self, path) -> bytes:
+        path = Path(path).absolute()
+        key = ("raw",) + self._key(path)
+        data = self._get(key)
+        if data is None:
+            data = path.read_bytes()
+            self._put(key, data)
+        return data
+
+    def get_base64(self, path) -> str:
+        path = Path(path).absolute()
+        key = ("b64",) + self._key(path)
+        encoded = self._get(key)
+        if encoded is None:
+            encoded = base64.b64encode(path.read_bytes()).decode()
+            self._put(key, encoded)
+        return encoded
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+asset_cache = AssetCache()
+
@@ -0,0 +1,52 @@
+import os
+import random
+import time
+
+# "first" always shows the first available image, "random" picks one per
+# session, "rotate" advances to the next image once the interval has elapsed.
+BACKGROUND_MODES = ("first", "random", "rotate")
+DEFAULT_MODE = os.getenv("PORTFOLIO_BACKGROUND_MODE", "first")
+DEFAULT_INTERVAL = float(os.getenv("PORTFOLIO_BACKGROUND_INTERVAL", 30))
+
+
+def _first_existing(paths, start):
+    """Return (index, path) of the first existing file at or after start, wrapping around."""
+    for offset in range(len(paths)):
+        index = (start + offset) % len(paths)
+        if os.path.exists(paths[index]):
+            return index, paths[index]
+    return None, None
+
+
+def select_background(paths, state, mode=None, interval=None, now=None):
+    """Pick the single background path to show on this run.
+
+    Only the chosen path is touched on disk, so callers encode one image
+    instead of every candidate. ``state`` is a mutable mapping (normally
+    ``st.session_state``) used to remember the current image per session.
+    Returns None when no candidate exists.
+    """
+    if not paths:
+        return None
+    mode = mode or DEFAULT_MODE
+    if mode not in BACKGROUND_MODES:
+        mode = "first"
+    interval = DEFAULT_INTERVAL if interval is None else interval
+    now = time.time() if now is None else now
+
+    if mode == "first":
+        return _first_existing(paths, 0)[1]
+
+    index = state.get("bg_index")
+    if index is None:
+        start = random.randrange(len(paths)) if mode == "random" else 0
+        state["bg_changed_at"] = now
+    elif mode == "rotate" and now - state.get("bg_changed_at", now) >= interval:
+        start = index + 1
+        state["bg_changed_at"] = now
+    else:
+        start = index
+
+    index, path = _first_existing(paths, start)
+    state["bg_index"] = index
+    return path
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+
+# Skills and projects shown by the pages and used by the chatbot; edit the
+# file and the next rerun picks it up, no code change or restart needed.
+DATA_PATH = Path(os.getenv(
+    "PORTFOLIO_DATA_PATH",
+    Path(__file__).parent.parent.absolute() / "data" / "portfolio.json",
+))
+SCHEMA = 1
+
+
+class ContentError(ValueError):
+    """The data file is missing a field or has a wrong type."""
+
+
+@dataclass(frozen=True)
+class Level:
+    name: str
+    level: int
+
+
+@dataclass(frozen=True)
+class SkillGroup:
+    category: str
+    items: Tuple[str, ...]
+
+    @property
+    def text(self) -> str:
+        return ", ".join(self.items)
+
+
+@dataclass(frozen=True)
+class Project:
+    name: str
+    description: str
+    technologies: Tuple[str, ...]
+    link: str
+    icon: str = ""
+
+
+@dataclass(frozen=True)
+class Content:
+    """Parsed portfolio data. Immutable, so one instance is shared by every session."""
+
+    version: str
+    languages: Tuple[Level, ...]
+    tools: Tuple[SkillGroup, ...]
+    expertise: Tuple[Level, ...]
+    focus_areas: Tuple[str, ...]
+    core_skills: Tuple[SkillGroup, ...]
+    projects: Tuple[Project, ...]
+
+
+def _field(entry, name, kind, where):
+    try:
+        value = entry[name]
+    except (KeyError, TypeError):
+        raise ContentError(f"{where}: missing {name!r}") from None
+    if not isinstance(value, kind):
+        raise ContentError(f"{where}.{name}: expected {kind.__name__}, got {type(value).__name__}")
+    return value
+
+
+def _strings(entry, name, where):
+    values = _field(entry, name, list, where)
+    if not all(isinstance(v, str) for v in values):
+        raise ContentError(f"{where}.{name}: expected a list of strings")
+    return tuple(values)
+
+
+def _levels(data, name):
+    return tuple(
+        Level(_field(e, "name", str, f"{name}[{i}]"), _field(e, "level", int, f"{name}[{i}]"))
+        for i, e in enumerate(_field(data, name, list, "portfolio"))
+    )
+
+
+def _groups(data, name):
+    return tuple(
+        SkillGroup(_field(e, "category", str, f"{name}[{i}]"), _strings(e, "items", f"{name}[{i}]"))
+        for i, e in enumerate(_field(data, name, list, "portfolio"))
+    )
+
+
+def parse(raw: bytes) -> Content:
+    """Validate the JSON document and turn it into a Content."""
+    data = json.loads(raw)
+    if data.get("schema") != SCHEMA:
+        raise ContentError(f"unsupported schema {data.get('schema')!r}; expected {SCHEMA}")
+    projects = tuple(
+        Project(
+            name=_field(e, "name", str, f"projects[{i}]"),
+            description=_field(e, "description", str, f"projects[{i}]"),
+            technologies=_strings(e, "technologies", f"projects[{i}]"),
+            link=_field(e, "link", str, f"projects[{i}]"),
+            icon=e.get("icon", ""),
+        )
+        for i, e in enumerate(_field(data, "projects", list, "portfolio"))
+    )
+    return Content(
+        version=hashlib.sha256(raw).hexdigest()[:12],
+        languages=_levels(data, "languages"),
+        tools=_groups(data, "tools"),
+        expertise=_levels(data, "expertise"),
+        focus_areas=_strings(data, "focus_areas", "portfolio"),
+        core_skills=_groups(data, "core_skills"),
+        projects=projects,
+    )
+
+
+_content = {"key": None, "data": None}
+_lock = threading.Lock()
+
+
+def data_version(path=DATA_PATH) -> tuple:
+    """Stat signature of the data file; changes whenever it is edited."""
+    stat = Path(path).stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def get_content() -> Content:
+    """Process-wide parsed content, re-read only when the file changes.
+
+    A touched file whose bytes hash the same keeps the existing object, so
+    anything cached on it (figures, the retrieval index) stays valid.
+    """
+    key = data_version()
+    with _lock:
+        if _content["key"] != key:
+            raw = DATA_PATH.read_bytes()
+            if _content["data"] is None or _content["data"].version != hashlib.sha256(raw).hexdigest()[:12]:
+                _content["data"] = parse(raw)
+            _content["key"] = key
+        return _content["data"]
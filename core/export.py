@@ -0,0 +1,178 @@
+"""Pre-render the content-only pages to a static site.
+
+    python -m core.export                          # writes dist/
+    python -m core.export --out site --app-url https://portfolio.example.com
+
+The landing, Projects and About pages are built from the same markup and
+stylesheets as the Streamlit pages (core/render.py, core/theme.py) into plain
+HTML files. Images and per-page CSS go to <out>/assets/ under content-hashed
+names, so everything there can be served from any static host or CDN with
+``Cache-Control: public, max-age=31536000, immutable``. Links to the
+interactive Dashboard and Chatbot point at the running Streamlit app.
+"""
+import argparse
+import hashlib
+import os
+import re
+import shutil
+from html import escape
+from pathlib import Path
+
+from core.content import get_content
+from core.render import (
+    ABOUT_HEADING, find_background, find_profile, hero_html, page_background, profile_header_html,
+    profile_picture, project_card_html, summary_html,
+)
+from core.static import ASSET_BASE_URL, STATIC_DIR
+from core.theme import style_tag
+
+ROOT = Path(__file__).parent.parent.absolute()
+DEFAULT_OUT = ROOT / "dist"
+ASSETS_SUBDIR = "assets"
+
+# Where the Streamlit app (dashboard, chatbot, contact form) is running
+APP_URL = os.getenv("PORTFOLIO_APP_URL", "http://localhost:8501").rstrip("/")
+
+# Stand-ins for the layout Streamlit provides around the page markup
+LAYOUT_CSS = """
+* { box-sizing: border-box; }
+body { margin: 0; font-family: "Source Sans Pro", system-ui, sans-serif; color: white; background: #0E1117; }
+.stApp { min-height: 100vh; padding: 3rem 1.5rem; }
+.page { max-width: 1200px; margin: 0 auto; }
+.columns { display: flex; flex-wrap: wrap; gap: 2rem; align-items: flex-start; }
+.columns > div { flex: 1 1 300px; }
+.nav { display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 1rem; }
+.nav-link a { color: white; text-decoration: none; font-size: 1.1em; }
+.stApp a { color: #64FFDA; }
+"""
+
+_STYLE_TAG = re.compile(r"</?style>")
+_PUBLISHED_URL = re.compile(re.escape(ASSET_BASE_URL) + r"/([\w.\-]+)")
+
+
+def _css(*blocks) -> str:
+    """Concatenate <style> blocks from core.theme into one stylesheet."""
+    return "\n".join(_STYLE_TAG.sub("", block) for block in blocks if block)
+
+
+def _background(page):
+    path = find_background(page)
+    return page_background(page, path) if path else None
+
+
+def _picture(page):
+    path = find_profile(page)
+    return profile_picture(page, path) if path else None
+
+
+def landing_page():
+    profile = _picture("main")
+    nav = "".join(
+        f'<div class="nav-link"><a href="{href}">{icon} {label}</a></div>'
+        for href, icon, label in (
+            (f"{APP_URL}/dashboard", "📊", "Dashboard"),
+            (f"{APP_URL}/chatbot", "💬", "Chatbot"),
+            ("projects.html", "🚀", "Projects"),
+            ("about.html", "👩🏻‍💻", "About Me"),
+        )
+    )
+    body = f"""
+    <div style="background-color: rgba(0,0,0,0.6); padding: 30px; border-radius: 15px; color: white; margin: 20px;">
+    <div class="columns"><div style="flex-grow: 3">{hero_html()}</div><div>{profile or ""}</div></div>
+    <h2>Explore My Portfolio</h2>
+    <div class="nav">{nav}</div>
+    </div>
+    """
+    css = _css(style_tag("main", _background("main")))
+    return "Hafsa Kamali's Portfolio", css, body
+
+
+def projects_page():
+    profile = _picture("projects")
+    cards = "".join(f"<div>{project_card_html(project)}</div>" for project in get_content().projects)
+    body = f"""
+    {profile_header_html(profile) if profile else ""}
+    <div class="columns">{cards}</div>
+    """
+    return "Projects - Hafsa Kamali", _css(style_tag("projects", _background("projects"))), body
+
+
+def about_page():
+    profile = _picture("about")
+    body = f"""
+    <div class="about-container">
+    {ABOUT_HEADING}
+    <div class="columns"><div>{profile or ""}</div><div style="flex-grow: 2">{summary_html(get_content())}</div></div>
+    <h2>📬 Get in Touch</h2>
+    <p><a href="{APP_URL}/about_me">Send a message through the contact form</a></p>
+    </div>
+    """
+    css = _css(style_tag("about", _background("about")))
+    return "About Me - Hafsa Kamali", css, body
+
+
+PAGES = {"index.html": landing_page, "projects.html": projects_page, "about.html": about_page}
+
+
+def _copy_published(text, assets_out, prefix):
+    """Copy every published asset referenced in ``text`` and rewrite its URL to ``prefix + name``."""
+    def replace(match):
+        name = match.group(1)
+        target = assets_out / name
+        if not target.exists():
+            shutil.copyfile(STATIC_DIR / name, target)
+        return prefix + name
+
+    return _PUBLISHED_URL.sub(replace, text)
+
+
+def _write_hashed(assets_out, stem, suffix, data: bytes) -> str:
+    name = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{suffix}"
+    target = assets_out / name
+    if not target.exists():
+        target.write_bytes(data)
+    return name
+
+
+def export(out=DEFAULT_OUT, base_url=ASSETS_SUBDIR) -> dict:
+    """Render every page in PAGES into ``out``; returns {file name: bytes written}.
+
+    ``base_url`` is where <out>/assets/ will be served from: the default
+    relative path, or a CDN URL the folder is uploaded to.
+    """
+    out = Path(out)
+    assets_out = out / ASSETS_SUBDIR
+    assets_out.mkdir(parents=True, exist_ok=True)
+    base_url = base_url.rstrip("/")
+    # Stylesheets live next to the images, so a relative base means same folder
+    css_prefix = "" if base_url == ASSETS_SUBDIR else f"{base_url}/"
+
+    written = {}
+    for filename, build in PAGES.items():
+        title, css, body = build()
+        css = _copy_published(LAYOUT_CSS + css, assets_out, css_prefix)
+        stylesheet = _write_hashed(assets_out, Path(filename).stem, ".css", css.encode("utf-8"))
+        body = _copy_published(body, assets_out, f"{base_url}/")
+        html = (
+            "<!DOCTYPE html>\n"
+            '<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+            f"<title>{escape(title)}</title>\n"
+            f'<link rel="stylesheet" href="{base_url}/{stylesheet}">\n'
+            f'</head>\n<body>\n<div class="stApp"><main class="page">{body}</main></div>\n</body>\n</html>\n'
+        )
+        (out / filename).write_text(html, encoding="utf-8")
+        written[filename] = len(html.encode("utf-8"))
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="output folder (default: dist/)")
+    parser.add_argument("--base-url", default=ASSETS_SUBDIR, help="URL <out>/assets/ is served from")
+    parser.add_argument("--app-url", help="URL of the running Streamlit app (default: $PORTFOLIO_APP_URL)")
+    args = parser.parse_args()
+    if args.app_url:
+        APP_URL = args.app_url.rstrip("/")
+    for filename, size in export(args.out, args.base_url).items():
+        print(f"{args.out / filename}: {size // 1024} KB")
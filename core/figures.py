@@ -0,0 +1,88 @@
+from functools import lru_cache
+from typing import Tuple
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objs as go
+
+from core.content import Level, SkillGroup
+
+# Figures are built once per distinct data and shared by every session, so
+# callers must treat them as read-only (st.plotly_chart does not modify them).
+# Arguments are the immutable tuples from core.content, so they serve as cache
+# keys; edited data means a new key, which is what triggers a rebuild.
+
+
+@lru_cache(maxsize=16)
+def language_figure(languages: Tuple[Level, ...]) -> go.Figure:
+    df_languages = pd.DataFrame({
+        'Skill': [l.name for l in languages],
+        'Proficiency': [l.level for l in languages]
+    })
+    fig_languages = px.bar(
+        df_languages,
+        x='Skill',
+        y='Proficiency',
+        title='Programming Languages & Frameworks',
+        color='Skill',
+        color_discrete_sequence=px.colors.sequential.Viridis
+    )
+    fig_languages.update_layout(
+        plot_bgcolor='rgba(10, 25, 47, 0.8)',
+        paper_bgcolor='rgba(10, 25, 47, 0.5)',
+        font_color='white'
+    )
+    return fig_languages
+
+
+@lru_cache(maxsize=16)
+def tools_table(tools: Tuple[SkillGroup, ...]) -> pd.DataFrame:
+    return pd.DataFrame({'Category': [g.category for g in tools], 'Tools': [g.text for g in tools]})
+
+
+@lru_cache(maxsize=16)
+def tools_styler(tools: Tuple[SkillGroup, ...]):
+    """``tools_table`` styled for st.table (a pandas Styler).
+
+    st.table re-applies the Styler's own style steps when it renders, which
+    gives the same result every time, so one Styler serves every session.
+    """
+    return tools_table(tools).style.set_properties(**{
+        'background-color': 'rgba(10, 25, 47, 0.7)',
+        'color': 'white',
+        'border-color': '#64FFDA'
+    })
+
+
+@lru_cache(maxsize=16)
+def expertise_radar(expertise: Tuple[Level, ...]) -> go.Figure:
+    fig_radar = go.Figure(data=go.Scatterpolar(
+        r=[e.level for e in expertise],
+        theta=[e.name for e in expertise],
+        fill='toself',
+        line_color='#64FFDA',
+        fillcolor='rgba(100, 255, 218, 0.2)'
+    ))
+    fig_radar.update_layout(
+        title='Professional Expertise Radar',
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                color='white'
+            ),
+            bgcolor='rgba(10, 25, 47, 0.5)'
+        ),
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='white'
+    )
+    return fig_radar
+
+
+def cache_info() -> dict:
+    return {
+        "language_figure": language_figure.cache_info()._asdict(),
+        "tools_table": tools_table.cache_info()._asdict(),
+        "tools_styler": tools_styler.cache_info()._asdict(),
+        "expertise_radar": expertise_radar.cache_info()._asdict(),
+    }
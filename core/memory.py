@@ -0,0 +1,92 @@
+import os
+import re
+from collections import deque
+
+# Recent turns sent verbatim, and the rough token budget for the whole history
+MEMORY_TURNS = int(os.getenv("CHATBOT_MEMORY_TURNS", 6))
+MEMORY_TOKENS = int(os.getenv("CHATBOT_MEMORY_TOKENS", 2000))
+# Share of the budget the running summary of older turns may use
+SUMMARY_SHARE = 0.25
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English text)."""
+    return len(text) // 4 + 1
+
+
+def _clip(text, limit):
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1].rstrip() + "…"
+
+
+def extractive_summary(summary: str, user: str, assistant: str) -> str:
+    """Fold one turn into the summary without calling a model.
+
+    Keeps the question and the first sentence of the answer.
+    """
+    first_sentence = _SENTENCE_END.split(assistant.strip(), maxsplit=1)[0]
+    line = f"- User asked: {_clip(user, 160)} / Assistant: {_clip(first_sentence, 200)}"
+    return f"{summary}\n{line}" if summary else line
+
+
+class ConversationMemory:
+    """Sliding window of recent turns plus a running summary of older ones.
+
+    The history handed to the model stays within ``token_budget`` tokens, so
+    request size and latency stay roughly flat however long the chat gets.
+    ``summarizer(summary, user, assistant) -> str`` folds an evicted turn
+    into the summary; the default is extractive and free.
+    """
+
+    def __init__(self, max_turns=MEMORY_TURNS, token_budget=MEMORY_TOKENS, summarizer=extractive_summary):
+        self.max_turns = max_turns
+        self.token_budget = token_budget
+        self.summarizer = summarizer
+        self.turns = deque()
+        self.summary = ""
+
+    def add(self, user: str, assistant: str):
+        self.turns.append((user, assistant))
+        self._compact()
+
+    def _turns_tokens(self):
+        return sum(estimate_tokens(u) + estimate_tokens(a) for u, a in self.turns)
+
+    def _compact(self):
+        summary_budget = int(self.token_budget * SUMMARY_SHARE)
+        while len(self.turns) > 1 and (
+            len(self.turns) > self.max_turns
+            or self._turns_tokens() + estimate_tokens(self.summary) > self.token_budget
+        ):
+            user, assistant = self.turns.popleft()
+            self.summary = self.summarizer(self.summary, user, assistant)
+            # Oldest summary lines go first once the summary outgrows its share
+            lines = self.summary.splitlines()
+            while len(lines) > 1 and estimate_tokens("\n".join(lines)) > summary_budget:
+                lines.pop(0)
+            self.summary = "\n".join(lines)
+
+    def history(self) -> list:
+        """History in the generative-ai SDK ``Content`` dict format."""
+        history = []
+        if self.summary:
+            history.append({"role": "user", "parts": [f"Summary of our earlier conversation:\n{self.summary}"]})
+            history.append({"role": "model", "parts": ["Got it, I'll keep that in mind."]})
+        for user, assistant in self.turns:
+            history.append({"role": "user", "parts": [user]})
+            history.append({"role": "model", "parts": [assistant]})
+        return history
+
+    def clear(self):
+        self.turns.clear()
+        self.summary = ""
+
+    def snapshot(self) -> dict:
+        """JSON-serialisable copy of the turns and summary (see core/sessions.py)."""
+        return {"turns": [list(turn) for turn in self.turns], "summary": self.summary}
+
+    def restore(self, snapshot: dict):
+        self.turns = deque(tuple(turn) for turn in snapshot.get("turns", ()))
+        self.summary = snapshot.get("summary", "")
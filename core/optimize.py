@@ -0,0 +1,152 @@
+"""Build resized, recompressed variants of the images in assets/.
+
+    python -m core.optimize            # build missing/stale variants
+    python -m core.optimize --force    # rebuild everything
+
+For every source image this writes WebP (and AVIF when Pillow supports it)
+plus a JPEG fallback -- PNG for images with real transparency -- at several
+widths into assets/optimized/, and records them in manifest.json:
+
+    {"version": 2, "assets": {"hafsa.png": {
+        "source_size": ..., "source_mtime_ns": ..., "width": 938, "height": 939,
+        "variants": [{"file": "hafsa-png-300.webp", "format": "webp",
+                      "width": 300, "height": 300, "bytes": 21034}, ...]}}}
+
+Variant names keep the source extension, so hafsa.png and hafsa.jpeg never
+overwrite each other's files.
+
+Requires Pillow (``pip install pillow``); the app itself does not.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from core.variants import MANIFEST_PATH, MANIFEST_VERSION, OPTIMIZED_DIR
+
+ASSETS_DIR = OPTIMIZED_DIR.parent
+SOURCE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# Avatars are shown at 150-300 px and backgrounds full-viewport, so cover both
+# ranges including 2x densities. Widths above the source width are skipped.
+WIDTHS = (150, 300, 600, 960, 1280, 1920, 2560)
+QUALITY = {"avif": 50, "webp": 75, "jpeg": 80}
+
+
+def _has_alpha(image) -> bool:
+    if image.mode not in ("RGBA", "LA", "PA") and "transparency" not in image.info:
+        return False
+    alpha = image.convert("RGBA").getchannel("A")
+    return alpha.getextrema()[0] < 255
+
+
+def _formats(has_alpha):
+    from PIL import features
+
+    formats = ["webp"]
+    if features.check("avif"):
+        formats.insert(0, "avif")
+    formats.append("png" if has_alpha else "jpeg")
+    return formats
+
+
+def _save(image, path, fmt):
+    if fmt == "jpeg":
+        image.convert("RGB").save(path, "JPEG", quality=QUALITY["jpeg"], optimize=True, progressive=True)
+    elif fmt == "png":
+        image.save(path, "PNG", optimize=True)
+    else:
+        image.save(path, fmt.upper(), quality=QUALITY[fmt])
+
+
+def optimize_image(source: Path) -> dict:
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        has_alpha = _has_alpha(image)
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        width, height = image.size
+
+        widths = [w for w in WIDTHS if w < width] + [width]
+        stem = f"{source.stem}-{source.suffix.lower().lstrip('.')}"
+        variants = []
+        for target in widths:
+            resized = image if target == width else image.resize(
+                (target, max(1, round(height * target / width))), Image.LANCZOS
+            )
+            for fmt in _formats(has_alpha):
+                ext = "jpg" if fmt == "jpeg" else fmt
+                out = OPTIMIZED_DIR / f"{stem}-{target}.{ext}"
+                _save(resized, out, fmt)
+                variants.append({
+                    "file": out.name,
+                    "format": fmt,
+                    "width": resized.size[0],
+                    "height": resized.size[1],
+                    "bytes": out.stat().st_size,
+                })
+
+    stat = source.stat()
+    return {
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "width": width,
+        "height": height,
+        "variants": variants,
+    }
+
+
+def build(force=False, verbose=True) -> dict:
+    OPTIMIZED_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {"version": MANIFEST_VERSION, "assets": {}}
+    if MANIFEST_PATH.exists() and not force:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            previous = json.load(f)
+        # Variants listed by an older layout are rebuilt under the current names
+        if previous.get("version") == MANIFEST_VERSION:
+            manifest = previous
+
+    sources = sorted(p for p in ASSETS_DIR.iterdir() if p.suffix.lower() in SOURCE_EXTENSIONS)
+    assets = {}
+    for source in sources:
+        stat = source.stat()
+        entry = manifest.get("assets", {}).get(source.name)
+        fresh = (
+            entry is not None
+            and entry.get("source_size") == stat.st_size
+            and entry.get("source_mtime_ns") == stat.st_mtime_ns
+            and all((OPTIMIZED_DIR / v["file"]).exists() for v in entry["variants"])
+        )
+        if not fresh:
+            entry = optimize_image(source)
+        assets[source.name] = entry
+        if verbose:
+            smallest = min(entry["variants"], key=lambda v: v["bytes"])
+            status = "cached" if fresh else "built"
+            print(f"{source.name}: {stat.st_size // 1024} KB -> {len(entry['variants'])} variants "
+                  f"({smallest['file']} {smallest['bytes'] // 1024} KB) [{status}]")
+
+    # Remove derivatives of sources that were deleted or rebuilt at other widths
+    keep = {v["file"] for entry in assets.values() for v in entry["variants"]}
+    for path in OPTIMIZED_DIR.iterdir():
+        if path != MANIFEST_PATH and path.name not in keep:
+            path.unlink()
+
+    manifest = {"version": MANIFEST_VERSION, "assets": assets}
+    tmp = MANIFEST_PATH.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    tmp.replace(MANIFEST_PATH)
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build optimized image variants for assets/.")
+    parser.add_argument("--force", action="store_true", help="rebuild every variant")
+    args = parser.parse_args()
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        sys.exit("core.optimize requires Pillow: pip install pillow")
+    build(force=args.force)
@@ -0,0 +1,275 @@
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# With PORTFOLIO_PERF=1 every page run is logged as one JSON record on the
+# "portfolio.perf" logger; when PORTFOLIO_PERF_LOG names a file, it is also
+# appended there as a JSON line. Otherwise only runs that show the panel
+# below are profiled.
+PERF_ENABLED = os.getenv("PORTFOLIO_PERF", "0") == "1"
+PERF_LOG = os.getenv("PORTFOLIO_PERF_LOG")
+
+# Show the profiling panel in the sidebar for every visitor; otherwise only
+# for sessions opened with ?debug=1
+PERF_PANEL = os.getenv("PORTFOLIO_PERF_PANEL", "0") == "1"
+
+logger = logging.getLogger("portfolio.perf")
+_log_lock = threading.Lock()
+_local = threading.local()
+
+# Phase that collects time and bytes spent outside any explicit phase
+UNTRACKED = "(page)"
+
+
+class PageProfile:
+    """Wall time and emitted bytes per phase for one run of a page script."""
+
+    def __init__(self, page):
+        self.page = page
+        self.started = time.perf_counter()
+        self.seconds = None
+        self.phases = {}
+        self.elements = {}
+        self.stack = []
+
+    def _phase(self, name):
+        return self.phases.setdefault(name, {"ms": 0.0, "bytes": 0, "calls": 0})
+
+    def add_bytes(self, element, size):
+        name = self.stack[-1] if self.stack else UNTRACKED
+        self._phase(name)["bytes"] += size
+        self.elements[element] = self.elements.get(element, 0) + size
+
+    def add_time(self, name, seconds):
+        phase = self._phase(name)
+        phase["ms"] += seconds * 1000
+        phase["calls"] += 1
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.elements.values())
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self.started
+        tracked = sum(p["ms"] for name, p in self.phases.items() if name != UNTRACKED)
+        self._phase(UNTRACKED)["ms"] = max(0.0, self.seconds * 1000 - tracked)
+
+    def to_dict(self) -> dict:
+        return {
+            "page": self.page,
+            "ms": round((self.seconds or 0) * 1000, 2),
+            "bytes": self.total_bytes,
+            "phases": {name: dict(p, ms=round(p["ms"], 2)) for name, p in self.phases.items()},
+            "elements": dict(self.elements),
+        }
+
+
+def current_profile():
+    return getattr(_local, "profile", None)
+
+
+def _element_type(msg) -> str:
+    """'markdown', 'plotly_chart', ... for element deltas; the message kind otherwise."""
+    kind = msg.WhichOneof("type")
+    if kind != "delta":
+        return kind or "unknown"
+    delta = msg.delta.WhichOneof("type")
+    if delta == "new_element":
+        return msg.delta.new_element.WhichOneof("type") or "element"
+    return delta or "delta"
+
+
+@contextmanager
+def _counting_bytes(profile):
+    """Attribute every ForwardMsg this script run sends to ``profile``.
+
+    Hooks the run context's enqueue callback, which is what Streamlit calls
+    for each element the page emits (st.markdown, st.plotly_chart, ...), so
+    no page code has to change. Does nothing outside a Streamlit run.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    enqueue = getattr(ctx, "_enqueue", None)
+    if enqueue is None:
+        yield
+        return
+
+    def counting(msg):
+        profile.add_bytes(_element_type(msg), msg.ByteSize())
+        enqueue(msg)
+
+    ctx._enqueue = counting
+    try:
+        yield
+    finally:
+        ctx._enqueue = enqueue
+
+
+@contextmanager
+def phase(name):
+    """Time a block of a page run and attribute the bytes it emits to ``name``."""
+    profile = current_profile()
+    if profile is None:
+        yield
+        return
+    profile.stack.append(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.stack.pop()
+        profile.add_time(name, time.perf_counter() - started)
+
+
+def _loaded(name, attribute):
+    """``name`` if it is imported and initialised (the warm-up may be importing it right now)."""
+    module = sys.modules.get(name)
+    return module if hasattr(module, attribute) else None
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters of the process-wide caches that are loaded in this process."""
+    stats = {}
+    if assets := _loaded("core.assets", "asset_cache"):
+        stats["asset bytes"] = assets.asset_cache.stats()
+    if responsive := _loaded("core.responsive", "stats"):
+        stats["image markup"] = responsive.stats()
+    if resolver := _loaded("core.resolver", "resolver"):
+        stats["asset manifest"] = resolver.resolver.stats()
+    if theme := _loaded("core.theme", "stylesheet"):
+        stats["stylesheets"] = theme.stylesheet.cache_info()._asdict()
+    if figures := _loaded("core.figures", "cache_info"):
+        builders = figures.cache_info().values()
+        stats["figures"] = {
+            "entries": sum(info["currsize"] for info in builders),
+            "hits": sum(info["hits"] for info in builders),
+            "misses": sum(info["misses"] for info in builders),
+        }
+    if response_cache := _loaded("core.response_cache", "get_response_cache"):
+        cache = response_cache.get_response_cache()
+        if cache is not None:
+            stats["chat responses"] = cache.stats()
+    if sessions := _loaded("core.sessions", "get_session_registry"):
+        stats["chat sessions"] = sessions.get_session_registry().stats()
+    if ratelimit := _loaded("core.ratelimit", "single_flight"):
+        stats["chat traffic"] = {
+            "coalesced": ratelimit.single_flight.coalesced,
+            "rate limited": ratelimit.rate_limiter.rejected,
+        }
+    if worker := _loaded("core.worker", "saturated"):
+        stats.setdefault("chat traffic", {})["pool saturated"] = worker.saturated
+    return stats
+
+
+def hit_rate(counters) -> float:
+    hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+    return hits / (hits + misses) if hits + misses else 0.0
+
+
+def _log(profile, caches):
+    ctx = get_script_run_ctx(suppress_warning=True)
+    record = dict(profile.to_dict(), session=getattr(ctx, "session_id", None), ts=round(time.time(), 3))
+    record["hit_rates"] = {
+        name: round(hit_rate(counters), 3) for name, counters in caches.items() if "hits" in counters
+    }
+    line = json.dumps(record)
+    logger.info(line)
+    if PERF_LOG:
+        with _log_lock, open(PERF_LOG, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def panel_enabled() -> bool:
+    if PERF_PANEL:
+        return True
+    try:
+        return st.query_params.get("debug") == "1"
+    except Exception:
+        return False
+
+
+def render_panel(profile, caches):
+    """Sidebar expander with the last run's phases, payload and cache counters."""
+    from core import warmup
+    from core.resolver import resolver
+
+    with st.sidebar.expander("🛠 Debug Info"):
+        st.markdown(f"**{profile.page}**: {profile.seconds * 1000:.1f} ms, {profile.total_bytes / 1024:.1f} KB sent")
+        rows = "\n".join(
+            f"| {name} | {p['ms']:.1f} | {p['bytes'] / 1024:.1f} |" for name, p in profile.phases.items()
+        )
+        st.markdown(f"| Phase | ms | KB |\n|---|---:|---:|\n{rows}")
+        elements = "\n".join(
+            f"| {name} | {size / 1024:.1f} |"
+            for name, size in sorted(profile.elements.items(), key=lambda item: -item[1])
+        )
+        st.markdown(f"| Element | KB |\n|---|---:|\n{elements}")
+        st.markdown("**Caches**")
+        st.json({
+            name: dict(counters, hit_rate=round(hit_rate(counters), 3)) if "hits" in counters else counters
+            for name, counters in caches.items()
+        }, expanded=False)
+        sessions = caches.get("chat sessions")
+        if sessions:
+            st.markdown(
+                f"**Chat sessions**: {sessions['resident']} in memory, "
+                f"{sessions['closed'] + sessions['expired'] + sessions['evicted_for_budget']} evicted, "
+                f"{sessions['bytes'] / 1024:.1f} KB of {sessions['budget_bytes'] / 1024 / 1024:.0f} MB"
+            )
+        results = warmup.report()
+        if results is not None:
+            progress = "" if warmup.is_ready() else f" (running, {len(results)}/{len(warmup.STEPS)} steps)"
+            st.markdown(f"**Warm-up**{progress}")
+            st.markdown("\n".join(
+                f"- {r.name}: {r.seconds * 1000:.0f} ms" + (f" ({r.error})" if r.error else "") for r in results
+            ))
+        st.markdown(f"**Assets** (`{resolver.directory}`)")
+        if resolver.directory.exists():
+            st.markdown("\n".join(f"- `{a.name}` ({a.width}×{a.height})" for a in resolver.images()))
+        else:
+            st.error("Assets directory doesn't exist!")
+
+
+@contextmanager
+def profile_page(page):
+    """Profile one run of a page script: log it and, if enabled, show the panel."""
+    logging_enabled = PERF_ENABLED or bool(PERF_LOG)
+    show_panel = panel_enabled()
+    if not (logging_enabled or show_panel) or current_profile() is not None:
+        yield None
+        return
+    profile = PageProfile(page)
+    _local.profile = profile
+    completed = False
+    try:
+        with _counting_bytes(profile):
+            yield profile
+        completed = True
+    finally:
+        _local.profile = None
+        profile.finish()
+        show_panel = show_panel and completed
+        if logging_enabled or show_panel:
+            caches = cache_stats()
+            if logging_enabled:
+                _log(profile, caches)
+            if show_panel:
+                render_panel(profile, caches)
+
+
+def profiled(page):
+    """Decorator for a page's ``main()``: runs it inside ``profile_page``."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with profile_page(page):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
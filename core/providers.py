@@ -0,0 +1,128 @@
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Iterator, List
+
+# "gemini" (default) or "local" for the offline stand-in used in benchmarks/CI
+BACKEND = os.getenv("CHATBOT_BACKEND", "gemini")
+GEMINI_MODEL = os.getenv("CHATBOT_MODEL", "gemini-2.0-flash")
+
+LOCAL_LATENCY = float(os.getenv("CHATBOT_LOCAL_LATENCY", 0.3))
+LOCAL_TOKENS_PER_SECOND = float(os.getenv("CHATBOT_LOCAL_TOKENS_PER_SEC", 40))
+
+
+class ChatProvider(ABC):
+    """A model backend: turns a bounded history plus a new message into a reply.
+
+    ``history`` uses the generative-ai SDK ``Content`` dict format
+    (``{"role": "user" | "model", "parts": [text]}``). Implementations must be
+    safe to share between sessions; per-session state lives in the caller.
+    """
+
+    name = "base"
+    label = "Unknown"
+    model_name = ""
+
+    @abstractmethod
+    def send(self, history: List[dict], message: str, timeout: float) -> str:
+        """The full reply to ``message``, given ``history``."""
+
+    def stream(self, history: List[dict], message: str, timeout: float) -> Iterator[str]:
+        yield self.send(history, message, timeout)
+
+
+class GeminiProvider(ChatProvider):
+    name = "gemini"
+    label = "Google AI"
+
+    def __init__(self, model_name=GEMINI_MODEL, api_key=None):
+        # Imported here so the local backend works without the SDK installed
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key or os.getenv("GEMINI_API_KEY"))
+        self.model_name = model_name
+        # One model object (and SDK client / HTTP transport) per process
+        self.model = genai.GenerativeModel(model_name)
+
+    def send(self, history, message, timeout):
+        chat = self.model.start_chat(history=history)
+        return chat.send_message(message, request_options={"timeout": timeout}).text
+
+    def stream(self, history, message, timeout):
+        chat = self.model.start_chat(history=history)
+        for chunk in chat.send_message(message, stream=True, request_options={"timeout": timeout}):
+            if chunk.text:
+                yield chunk.text
+
+
+class LocalProvider(ChatProvider):
+    """Deterministic offline stand-in with configurable latency and token rate.
+
+    Replies come from ``responses`` (first keyword found in the message wins)
+    or echo the message back. Time-to-first-token is ``latency`` seconds and
+    each following word takes ``1 / tokens_per_second``, so benchmarks can
+    separate our own overhead from upstream latency.
+    """
+
+    name = "local"
+    label = "Local stub"
+    model_name = "local-echo"
+
+    DEFAULT_RESPONSES = {
+        "project": "Hafsa has built a BMI Calculator, a Library Management System, a Password "
+                   "Generator, a Face Emotion Detector, a Unit Converter and a Growth Mind Challenge app.",
+        "skill": "Her core skills are Python, JavaScript, TypeScript, HTML/CSS and React, plus "
+                 "Streamlit, Flask, TensorFlow and PyTorch.",
+        "hello": "Hello! I'm Hafsa's portfolio assistant. Ask me about her projects or skills.",
+    }
+
+    def __init__(self, latency=LOCAL_LATENCY, tokens_per_second=LOCAL_TOKENS_PER_SECOND, responses=None):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.responses = self.DEFAULT_RESPONSES if responses is None else responses
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def reply(self, history, message) -> str:
+        # Retrieval may wrap the question; answer the question itself
+        question = message.rsplit("Question: ", 1)[-1]
+        lowered = question.casefold()
+        for keyword, response in self.responses.items():
+            if keyword in lowered:
+                return response
+        return f"(turn {len(history) // 2 + 1}) You said: {question}"
+
+    def _token_delay(self):
+        return 1.0 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def send(self, history, message, timeout):
+        with self._lock:
+            self.calls += 1
+        text = self.reply(history, message)
+        time.sleep(min(timeout, self.latency + len(text.split()) * self._token_delay()))
+        return text
+
+    def stream(self, history, message, timeout):
+        with self._lock:
+            self.calls += 1
+        time.sleep(min(timeout, self.latency))
+        delay = self._token_delay()
+        for word in re.findall(r"\S+\s*", self.reply(history, message)):
+            if delay:
+                time.sleep(delay)
+            yield word
+
+
+PROVIDERS = {"gemini": GeminiProvider, "local": LocalProvider}
+
+
+@lru_cache(maxsize=None)
+def get_provider(name: str = None) -> ChatProvider:
+    """Process-wide provider instance selected by CHATBOT_BACKEND."""
+    name = name or BACKEND
+    if name not in PROVIDERS:
+        raise ValueError(f"Unknown CHATBOT_BACKEND {name!r}; expected one of {sorted(PROVIDERS)}")
+    return PROVIDERS[name]()
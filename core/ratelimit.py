@@ -0,0 +1,213 @@
+import os
+import threading
+import time
+
+from core.worker import POLL_INTERVAL, CancelToken, RequestCancelled
+
+# Sustained messages per minute and burst size, per session and per process
+SESSION_RATE = float(os.getenv("CHATBOT_SESSION_RATE", 6))
+SESSION_BURST = int(os.getenv("CHATBOT_SESSION_BURST", 3))
+GLOBAL_RATE = float(os.getenv("CHATBOT_GLOBAL_RATE", 120))
+GLOBAL_BURST = int(os.getenv("CHATBOT_GLOBAL_BURST", 20))
+
+# Session buckets untouched for this long are dropped (they would be full anyway)
+IDLE_BUCKET_SECONDS = 3600
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, up to ``capacity``."""
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, tokens=1) -> bool:
+        with self._lock:
+            self._refill(self.clock())
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+
+    def refund(self, tokens=1):
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + tokens)
+
+    def retry_after(self, tokens=1) -> float:
+        """Seconds until ``tokens`` will be available."""
+        with self._lock:
+            self._refill(self.clock())
+            missing = tokens - self.tokens
+            return max(0.0, missing / self.rate) if self.rate > 0 else float("inf")
+
+
+class RateLimiter:
+    """Per-session token buckets behind one process-wide bucket."""
+
+    def __init__(self, session_rate=SESSION_RATE, session_burst=SESSION_BURST,
+                 global_rate=GLOBAL_RATE, global_burst=GLOBAL_BURST, clock=time.monotonic):
+        self.session_rate = session_rate / 60.0
+        self.session_burst = session_burst
+        self.clock = clock
+        self.global_bucket = TokenBucket(global_rate / 60.0, global_burst, clock)
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def _bucket(self, session_id):
+        with self._lock:
+            now = self.clock()
+            if len(self._sessions) > 1000:
+                self._sessions = {
+                    key: bucket for key, bucket in self._sessions.items()
+                    if now - bucket.updated < IDLE_BUCKET_SECONDS
+                }
+            bucket = self._sessions.get(session_id)
+            if bucket is None:
+                bucket = self._sessions[session_id] = TokenBucket(self.session_rate, self.session_burst, self.clock)
+            return bucket
+
+    def check(self, session_id):
+        """Take one message from the session and global budgets.
+
+        Returns ``(allowed, retry_after_seconds)``. A request rejected by the
+        global bucket does not use up the session's own budget.
+        """
+        bucket = self._bucket(session_id)
+        if not bucket.try_acquire():
+            self.rejected += 1
+            return False, bucket.retry_after()
+        if not self.global_bucket.try_acquire():
+            bucket.refund()
+            self.rejected += 1
+            return False, self.global_bucket.retry_after()
+        return True, 0.0
+
+
+class Flight:
+    """One in-progress upstream request that several callers may share."""
+
+    def __init__(self):
+        self.chunks = []
+        self.done = False
+        self.error = None
+        # Cancels the upstream call; set once every caller has left
+        self.cancel = CancelToken()
+        self.followers = 0
+        self._cond = threading.Condition()
+
+    def append(self, chunk):
+        with self._cond:
+            self.chunks.append(chunk)
+            self._cond.notify_all()
+
+    def finish(self, error=None):
+        with self._cond:
+            self.done = True
+            self.error = error
+            self._cond.notify_all()
+
+    def follow(self, cancel=None):
+        """Yield the chunks as they arrive, from the beginning.
+
+        Raises the upstream error if the request failed, and RequestCancelled
+        as soon as ``cancel`` is set.
+        """
+        index = 0
+        while True:
+            with self._cond:
+                while index >= len(self.chunks) and not self.done:
+                    if cancel is not None and cancel.cancelled:
+                        raise RequestCancelled()
+                    self._cond.wait(POLL_INTERVAL)
+                pending = self.chunks[index:]
+                done = self.done
+            for chunk in pending:
+                if cancel is not None and cancel.cancelled:
+                    raise RequestCancelled()
+                yield chunk
+            index += len(pending)
+            if done and index >= len(self.chunks):
+                if self.error is not None:
+                    raise self.error
+                return
+
+
+class SingleFlight:
+    """Coalesces identical concurrent requests into one upstream call.
+
+    The upstream call runs on its own thread, not on any caller's, and every
+    caller (the first included) follows it with its own cancel token. One
+    visitor stopping an answer therefore never cuts it short for the others;
+    the upstream call itself is only cancelled once nobody is following it.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def join(self, key, make_stream):
+        """Follow the flight for ``key``, starting ``make_stream(flight.cancel)`` if there is none."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = Flight()
+                threading.Thread(
+                    target=self._run, args=(key, flight, make_stream), name="chat-flight", daemon=True
+                ).start()
+            else:
+                self.coalesced += 1
+            flight.followers += 1
+            return flight
+
+    def leave(self, key, flight):
+        with self._lock:
+            flight.followers -= 1
+            if flight.followers or flight.done:
+                return
+            # Nobody is listening any more: later callers start a new request
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.cancel.cancel()
+
+    def _run(self, key, flight, make_stream):
+        try:
+            for chunk in make_stream(flight.cancel):
+                flight.append(chunk)
+            flight.finish()
+        except BaseException as exc:  # handed to the followers
+            flight.finish(error=exc)
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+    def stream(self, key, make_stream, cancel=None):
+        """Iterate ``make_stream(shared_cancel)`` once for all concurrent callers with the same key.
+
+        Every caller replays the chunks live from the start. Upstream errors
+        are raised to every caller; ``cancel`` stops only this caller, with
+        RequestCancelled.
+        """
+        flight = self.join(key, make_stream)
+        try:
+            yield from flight.follow(cancel)
+        finally:
+            self.leave(key, flight)
+
+    def do(self, key, fn, cancel=None):
+        """Call ``fn(shared_cancel)`` once for all concurrent callers with the same key."""
+        return "".join(self.stream(key, lambda shared: iter((fn(shared),)), cancel))
+
+
+rate_limiter = RateLimiter()
+single_flight = SingleFlight()
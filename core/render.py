@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+
+from core.content import Content, Project
+from core.resolver import resolver
+from core.responsive import background_css, picture_tag
+from core.theme import background_selector
+
+# Markup for the content-only parts of the site. The Streamlit pages and the
+# static export (core/export.py) both render from these, so they never drift.
+
+
+@dataclass(frozen=True)
+class PageImages:
+    """The images one page shows. Names are tried in order (core/resolver.py)."""
+    backgrounds: tuple
+    profiles: tuple
+    profile_width: int
+    profile_class: str
+    profile_alt: str = "Hafsa Kamali"
+    background_extensions: tuple = (".png", ".jpg", ".jpeg")
+
+
+# Also what the warm-up (core/warmup.py) builds, so it fills the same cache entries
+PAGE_IMAGES = {
+    "main": PageImages(
+        ("freepik__upload__26918.jpeg", "bg1.jpg", "bg2.jpg", "bg3.jpeg", "bg4.jpg", "bg5.jpg"),
+        ("hafsa.png",), 300, "custom-profile-image",
+    ),
+    "dashboard": PageImages(
+        ("bg3", "background", "bg"), ("hafsa", "profile", "hafsa_kamali"), 300, "profile-img", "Profile",
+        background_extensions=(".jpeg", ".jpg", ".png"),
+    ),
+    "projects": PageImages(("bg5.jpg",), ("hafsa.png",), 250, "profile-img"),
+    "about": PageImages(
+        ("bg2.jpg",),
+        ("hafsa.png", "hafi.jpg", "hafsa.jpeg", "profile.png", "profile.jpg", "profile.jpeg", "user.png", "avatar.png"),
+        300, "profile-image",
+    ),
+    "chatbot": PageImages(("bg4.jpg",), ("hafsa.png",), 150, "profile-img"),
+}
+
+
+def find_background(page):
+    images = PAGE_IMAGES[page]
+    return resolver.find(*images.backgrounds, extensions=images.background_extensions)
+
+
+def find_profile(page):
+    return resolver.find(*PAGE_IMAGES[page].profiles)
+
+
+def page_background(page, path):
+    """Responsive background rules for ``page`` showing ``path``."""
+    return background_css(background_selector(page), path)
+
+
+def profile_picture(page, path):
+    """The page's profile <picture> for ``path``, at the page's display width."""
+    images = PAGE_IMAGES[page]
+    return picture_tag(path, images.profile_width, images.profile_class, images.profile_alt)
+
+
+def _try_render(build, page, path, on_error):
+    if path is None:
+        return None
+    try:
+        return build(page, path)
+    except Exception as e:
+        on_error(f"Error loading image {path}: {str(e)}")
+        return None
+
+
+def page_images(page, on_error):
+    """The page's background rules and profile picture, each None if missing or broken.
+
+    Failures are reported through ``on_error(message)`` (``st.error`` on the pages).
+    """
+    return (
+        _try_render(page_background, page, find_background(page), on_error),
+        _try_render(profile_picture, page, find_profile(page), on_error),
+    )
+
+
+ABOUT_HEADING = '<h1>👩🏻‍💼 <span class="main-heading">Hafsa Kamali</span></h1>'
+
+
+def hero_html():
+    return """
+    <h1 style="color: white; font-size: 48px; margin-bottom: 20px;">Hello! I'm <span class="main-heading">Hafsa Kamali.</span></h1>
+    <p style="color: white; font-size: 20px; margin-bottom: 30px;">
+    I'm currently working on <strong class="sub-heading">training Machine Learning and AI models</strong> while also exploring the world of <strong class="sub-heading">Data Science</strong>. I'm a <strong class="sub-heading">certified Web Developer</strong>, specializing in <strong>Frontend technologies</strong> like <strong class="sub-heading">HTML, CSS, JavaScript, TypeScript, and Next.js</strong>.
+    </p>
+    <p style="color: white; font-size: 20px; margin-bottom: 20px;">
+    Beyond web development, I have a strong passion for <strong class="sub-heading">graphic design and video editing</strong>, bringing creativity into my projects. Additionally, I'm a <strong class="sub-heading">Python Developer</strong>, continuously expanding my expertise in AI and data-driven technologies.
+    </p>
+    <p style="color: white; font-size: 20px;">
+    Currently, I am part of the <strong class="sub-heading">Governor House IT Initiative</strong>, where I am enhancing my skills under the guidance of incredible mentors. My journey is all about blending technology with creativity to build impactful solutions. 🚀✨
+    </p>
+    """
+
+
+def profile_header_html(profile_image):
+    return f"""
+    {profile_image}
+    <div class="profile-name">Hafsa Kamali</div>
+    <div class="profile-bio">
+    A passionate Python developer and technology enthusiast with a keen interest in creating innovative software solutions. 
+    My journey in programming is driven by a curiosity to solve real-world problems through code. 
+    From health tech applications to utility tools, I strive to develop projects that make a meaningful impact. 
+    Each project is an opportunity to learn, grow, and push the boundaries of what's possible with technology.
+    </div>
+    """
+
+
+def project_card_html(project: Project):
+    return f"""
+    <div class="project-card">
+        <h3>{project.icon} {project.name}</h3>
+        <p>{project.description}</p>
+        <div>
+            {"".join([f'<span class="tech-badge">{tech}</span>' for tech in project.technologies])}
+        </div>
+        <br>
+        <a href="{project.link}" target="_blank" style="color: #64FFDA; text-decoration: none;">
+            🔗 Explore Project
+        </a>
+    </div>
+    """
+
+
+def summary_html(content: Content):
+    focus_areas = "".join(f"<li><strong>{area}</strong></li>" for area in content.focus_areas)
+    core_skills = "".join(
+        f"<li><strong>{group.category}:</strong> {group.text}</li>" for group in content.core_skills
+    )
+    return f"""
+    <h2>Professional Summary</h2>
+    <p>I'm a passionate technologist with expertise in:</p>
+    <ul>{focus_areas}</ul>
+    <h3>Core Skills</h3>
+    <ul>{core_skills}</ul>
+    <p>Currently part of the <strong>Governor House IT Initiative</strong>,
+    I blend technology with creativity to build impactful solutions.</p>
+    """
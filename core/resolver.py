@@ -0,0 +1,195 @@
+import hashlib
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+# The one assets folder every page reads from
+ASSETS_DIR = Path(os.getenv(
+    "PORTFOLIO_ASSETS_DIR",
+    Path(__file__).parent.parent.absolute() / "assets",
+))
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+# Without watchdog (or with PORTFOLIO_ASSET_WATCH=0) the folder is re-listed
+# at most this often, in seconds
+POLL_INTERVAL = float(os.getenv("PORTFOLIO_ASSET_POLL", 2))
+WATCH = os.getenv("PORTFOLIO_ASSET_WATCH", "1") != "0"
+
+
+@dataclass(frozen=True)
+class AssetInfo:
+    name: str
+    path: Path
+    size: int
+    mtime_ns: int
+    width: int
+    height: int
+    sha256: str
+
+    @property
+    def stem(self) -> str:
+        return self.path.stem.lower()
+
+
+def image_size(path):
+    """(width, height) read from a PNG or JPEG header, or (None, None).
+
+    Truncated or corrupt headers also give (None, None) rather than an error.
+    """
+    with open(path, "rb") as f:
+        try:
+            return _header_size(f)
+        except (struct.error, IndexError, ValueError):
+            return None, None
+
+
+def _header_size(f):
+    head = f.read(26)
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        return struct.unpack(">II", head[16:24])
+    if head[:2] != b"\xff\xd8":
+        return None, None
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None, None
+        length = struct.unpack(">H", f.read(2))[0]
+        # Start-of-frame markers carry the dimensions (C4, C8 and CC are not frames)
+        if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">xHH", f.read(5))
+            return width, height
+        if length < 2:
+            # The length counts its own two bytes; anything less would loop forever
+            return None, None
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _file_hash(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class AssetResolver:
+    """In-memory manifest of the images in ``directory``.
+
+    The folder is listed once; lookups are dictionary reads. The manifest is
+    rebuilt when a watchdog observer reports a change, or, without watchdog,
+    when a listing taken at most every ``poll_interval`` seconds differs.
+    Files whose size and mtime did not change keep their parsed entry, so a
+    refresh only hashes what was added or edited.
+    """
+
+    def __init__(self, directory=ASSETS_DIR, poll_interval=POLL_INTERVAL, watch=WATCH):
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self.watch = watch
+        self._files = {}
+        self._signature = None
+        self._checked_at = 0.0
+        self._dirty = True
+        self._observer = None
+        self._lock = threading.Lock()
+        self.scans = 0
+
+    def _listing(self):
+        try:
+            with os.scandir(self.directory) as entries:
+                listing = []
+                for entry in entries:
+                    if entry.is_file() and Path(entry.name).suffix.lower() in IMAGE_EXTENSIONS:
+                        stat = entry.stat()
+                        listing.append((entry.name, stat.st_mtime_ns, stat.st_size))
+                return tuple(sorted(listing))
+        except FileNotFoundError:
+            return ()
+
+    def _scan(self, listing):
+        previous = {info.name: info for info in self._files.values()}
+        files = {}
+        for name, mtime_ns, size in listing:
+            info = previous.get(name)
+            if info is None or (info.mtime_ns, info.size) != (mtime_ns, size):
+                path = self.directory / name
+                width, height = image_size(path)
+                info = AssetInfo(name, path, size, mtime_ns, width, height, _file_hash(path))
+            files[name.lower()] = info
+        self._files = files
+        self._signature = listing
+        self.scans += 1
+
+    def _start_watching(self):
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            self.watch = False
+            return
+        resolver = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Reads (including our own hashing and publishing) change nothing
+                if event.event_type not in ("opened", "closed", "closed_no_write"):
+                    resolver._dirty = True
+
+        try:
+            observer = Observer()
+            observer.schedule(Handler(), str(self.directory), recursive=False)
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+        except OSError:
+            # e.g. the folder does not exist yet, or inotify watches ran out
+            self.watch = False
+
+    def files(self) -> dict:
+        """Current manifest: lower-cased file name -> AssetInfo."""
+        with self._lock:
+            now = time.monotonic()
+            if self.watch and self._observer is None:
+                self._start_watching()
+            stale = self._dirty or (self._observer is None and now - self._checked_at >= self.poll_interval)
+            if stale:
+                self._dirty = False
+                self._checked_at = now
+                listing = self._listing()
+                if listing != self._signature:
+                    self._scan(listing)
+            return self._files
+
+    def info(self, name):
+        return self.files().get(name.lower())
+
+    def find(self, *candidates, extensions=(".png", ".jpg", ".jpeg")):
+        """Path of the first candidate present, or None.
+
+        A candidate with an extension must match that file name; a bare name
+        matches any of ``extensions``, tried in order.
+        """
+        files = self.files()
+        for candidate in candidates:
+            if Path(candidate).suffix:
+                names = (candidate,)
+            else:
+                names = (f"{candidate}{ext}" for ext in extensions)
+            for name in names:
+                info = files.get(name.lower())
+                if info is not None:
+                    return info.path
+        return None
+
+    def images(self) -> list:
+        return sorted(self.files().values(), key=lambda info: info.name.lower())
+
+    def stats(self) -> dict:
+        return {"files": len(self._files), "scans": self.scans, "watching": self._observer is not None}
+
+
+resolver = AssetResolver()
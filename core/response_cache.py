@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+# Backend selection: "memory", "sqlite" or "none"
+CACHE_BACKEND = os.getenv("CHATBOT_CACHE_BACKEND", "memory")
+CACHE_TTL = float(os.getenv("CHATBOT_CACHE_TTL", 6 * 60 * 60))
+CACHE_SIZE = int(os.getenv("CHATBOT_CACHE_SIZE", 1000))
+CACHE_PATH = Path(os.getenv(
+    "CHATBOT_CACHE_PATH", Path(__file__).parent.parent.absolute() / ".cache" / "responses.sqlite3"
+))
+
+# Like core/retrieval.py's tokens: "+", "#" and inner "." are part of a word,
+# so "C++", "C#" and "Node.js" stay distinct from "C" and "Node js"
+_TOKEN = re.compile(r"[\w+#.]+")
+
+
+def normalize(text: str) -> str:
+    """Case-fold, drop punctuation and collapse whitespace."""
+    tokens = (token.strip(".") for token in _TOKEN.findall(text.casefold()))
+    return " ".join(token for token in tokens if token)
+
+
+def history_digest(history) -> str:
+    """Digest of earlier (user, assistant) turns; empty for a first question.
+
+    An empty digest is what lets first-turn answers be shared across sessions.
+    """
+    if not history:
+        return ""
+    payload = json.dumps([[normalize(user), assistant] for user, assistant in history])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cache_key(prompt: str, history=()) -> str:
+    return hashlib.sha256(f"{history_digest(history)}\0{normalize(prompt)}".encode()).hexdigest()
+
+
+class MemoryBackend:
+    """Thread-safe in-process LRU with per-entry expiry."""
+
+    def __init__(self, max_entries=CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, now):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at):
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    """On-disk backend shared by every process pointing at the same file."""
+
+    def __init__(self, path=CACHE_PATH, max_entries=CACHE_SIZE):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+
+    def get(self, key, now):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key, value, expires_at):
+        with self._lock:
+            now = time.time()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    """TTL cache of assistant replies keyed on normalized prompt + history digest."""
+
+    def __init__(self, backend, ttl=CACHE_TTL):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, prompt, history=()):
+        value = self.backend.get(cache_key(prompt, history), time.time())
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, prompt, history, response):
+        self.backend.set(cache_key(prompt, history), response, time.time() + self.ttl)
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+@lru_cache(maxsize=None)
+def get_response_cache():
+    """Process-wide cache configured from the environment, or None if disabled."""
+    if CACHE_BACKEND == "none":
+        return None
+    if CACHE_BACKEND == "sqlite":
+        return ResponseCache(SQLiteBackend(CACHE_PATH, CACHE_SIZE), CACHE_TTL)
+    return ResponseCache(MemoryBackend(CACHE_SIZE), CACHE_TTL)
@@ -0,0 +1,148 @@
+import threading
+from html import escape
+from pathlib import Path
+
+from core.static import asset_url
+from core.variants import MANIFEST_PATH, get_variants
+
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+
+# Modern formats first; the browser takes the first type it supports
+FORMAT_ORDER = ("avif", "webp", "jpeg", "png")
+FALLBACK_FORMATS = ("jpeg", "png")
+
+# Viewport max-widths (px) that get their own background rule; wider screens
+# use BACKGROUND_MAX_WIDTH.
+BACKGROUND_BREAKPOINTS = (600, 960, 1280)
+BACKGROUND_MAX_WIDTH = 1920
+
+# High-density screens never get a background wider than this
+BACKGROUND_MAX_2X_WIDTH = 2560
+
+_cache = {}
+_lock = threading.Lock()
+_counts = {"hits": 0, "misses": 0}
+
+
+def _memoized(builder, source, *args):
+    """Cache generated markup until the source image or manifest changes."""
+    source = Path(source).absolute()
+    try:
+        stat = source.stat()
+    except FileNotFoundError:
+        return None
+    try:
+        manifest_stat = MANIFEST_PATH.stat()
+        manifest_key = (manifest_stat.st_mtime_ns, manifest_stat.st_size)
+    except FileNotFoundError:
+        manifest_key = None
+    key = (builder.__name__, str(source), stat.st_mtime_ns, stat.st_size, manifest_key) + args
+    with _lock:
+        if key in _cache:
+            _counts["hits"] += 1
+            return _cache[key]
+        _counts["misses"] += 1
+    value = builder(source, *args)
+    with _lock:
+        _cache[key] = value
+    return value
+
+
+def stats() -> dict:
+    with _lock:
+        return {"entries": len(_cache), **_counts}
+
+
+def _by_format(source):
+    grouped = {}
+    for variant in get_variants(source):
+        grouped.setdefault(variant["format"], []).append(variant)
+    for variants in grouped.values():
+        variants.sort(key=lambda v: v["width"])
+    return {fmt: grouped[fmt] for fmt in FORMAT_ORDER if fmt in grouped}
+
+
+def _pick(variants, width):
+    for variant in variants:
+        if variant["width"] >= width:
+            return variant
+    return variants[-1]
+
+
+def _image_set(grouped, width):
+    options = []
+    for fmt, variants in grouped.items():
+        for density in (1, 2):
+            target = min(width * density, max(width, BACKGROUND_MAX_2X_WIDTH))
+            url = asset_url(_pick(variants, target)["path"])
+            options.append(f'url("{url}") type("{MIME_TYPES[fmt]}") {density}x')
+    return f"image-set({', '.join(options)})"
+
+
+def _fallback(grouped, width):
+    for fmt in FALLBACK_FORMATS:
+        if fmt in grouped:
+            return asset_url(_pick(grouped[fmt], width)["path"])
+    return None
+
+
+def _build_background_css(source, selector, breakpoints, max_width):
+    grouped = _by_format(source)
+    if not grouped:
+        return f'{selector} {{ background-image: url("{asset_url(source)}"); }}'
+
+    def rule(width):
+        fallback = _fallback(grouped, width) or asset_url(source)
+        return (f'{selector} {{ background-image: url("{fallback}"); '
+                f'background-image: {_image_set(grouped, width)}; }}')
+
+    rules = [rule(max_width)]
+    for breakpoint in sorted(breakpoints, reverse=True):
+        rules.append(f"@media (max-width: {breakpoint}px) {{ {rule(breakpoint)} }}")
+    return "\n".join(rules)
+
+
+def background_css(selector, source, breakpoints=BACKGROUND_BREAKPOINTS, max_width=BACKGROUND_MAX_WIDTH):
+    """CSS rules giving ``selector`` a viewport-sized, format-negotiated background image.
+
+    Emits a plain ``url()`` fallback followed by an ``image-set()`` with
+    AVIF/WebP/JPEG at 1x and 2x, and a smaller variant per breakpoint so
+    phones never download the desktop image. Returns None if the source is
+    missing; without optimized variants the original file is used.
+    """
+    return _memoized(_build_background_css, source, selector, tuple(breakpoints), max_width)
+
+
+def _build_picture(source, width, css_class, alt):
+    grouped = _by_format(source)
+    alt = escape(alt)
+    if not grouped:
+        return f'<img src="{asset_url(source)}" class="{css_class}" alt="{alt}">'
+
+    sizes = f"{width}px"
+    sources = []
+    for fmt, variants in grouped.items():
+        if fmt in FALLBACK_FORMATS:
+            continue
+        srcset = ", ".join(f'{asset_url(v["path"])} {v["width"]}w' for v in variants)
+        sources.append(f'<source type="{MIME_TYPES[fmt]}" srcset="{srcset}" sizes="{sizes}">')
+
+    fallback_variants = next((grouped[fmt] for fmt in FALLBACK_FORMATS if fmt in grouped), None)
+    if fallback_variants:
+        src = asset_url(_pick(fallback_variants, width)["path"])
+        srcset = ", ".join(f'{asset_url(v["path"])} {v["width"]}w' for v in fallback_variants)
+        img = f'<img src="{src}" srcset="{srcset}" sizes="{sizes}" class="{css_class}" alt="{alt}">'
+    else:
+        img = f'<img src="{asset_url(source)}" class="{css_class}" alt="{alt}">'
+    return f"<picture>{''.join(sources)}{img}</picture>"
+
+
+def picture_tag(source, width, css_class="", alt=""):
+    """``<picture>`` markup for an image displayed ``width`` CSS px wide.
+
+    Each modern format gets a ``<source srcset>`` with every built width so
+    the browser picks the right file for the device pixel ratio; the ``<img>``
+    keeps the class and a JPEG/PNG fallback. Returns None if the source is
+    missing.
+    """
+    return _memoized(_build_picture, source, width, css_class, alt)
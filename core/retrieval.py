@@ -0,0 +1,158 @@
+import hashlib
+import math
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from html import unescape
+
+from core.content import Content, get_content
+from core.render import hero_html, profile_header_html, summary_html
+
+# Snippets injected into each prompt; set CHATBOT_RAG=0 to send prompts unchanged
+RAG_ENABLED = os.getenv("CHATBOT_RAG", "1") != "0"
+TOP_K = int(os.getenv("CHATBOT_RAG_K", 3))
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from has have her hers how i in is it its me my of on "
+    "or she tell that the their them they this to was what which who with you your about any some".split()
+)
+_TOKEN = re.compile(r"[a-z0-9+#.]+")
+_TAG = re.compile(r"<[^>]+>")
+
+
+@dataclass(frozen=True)
+class Document:
+    id: str
+    title: str
+    text: str
+
+
+def _stem(token):
+    # Just enough stemming to match "projects" with "project", "skills" with "skill"
+    return token[:-1] if len(token) > 3 and token.endswith("s") and not token.endswith("ss") else token
+
+
+def tokenize(text: str) -> list:
+    tokens = (t.strip(".") for t in _TOKEN.findall(text.casefold()))
+    return [_stem(t) for t in tokens if t and t not in STOPWORDS]
+
+
+def content_documents(content: Content) -> list:
+    """Documents for the skills and projects in the shared data file."""
+    projects = content.projects
+    docs = []
+    if projects:
+        names = ", ".join(p.name for p in projects)
+        docs.append(Document("projects:overview", "Projects", f"Projects built by Hafsa Kamali: {names}."))
+    for project in projects:
+        docs.append(Document(
+            f"project:{project.name}",
+            f"Project: {project.name}",
+            f"{project.name}: {project.description} "
+            f"Technologies: {', '.join(project.technologies)}. Repository: {project.link}",
+        ))
+    if content.languages:
+        levels = ", ".join(f"{l.name} ({l.level}%)" for l in content.languages)
+        docs.append(Document("skills:languages", "Programming languages & frameworks", f"Proficiency: {levels}."))
+    for group in content.tools:
+        docs.append(Document(f"tools:{group.category}", f"Tools: {group.category}", f"{group.category}: {group.text}."))
+    if content.expertise:
+        levels = ", ".join(f"{e.name} ({e.level}%)" for e in content.expertise)
+        docs.append(Document("skills:expertise", "Professional expertise", f"Expertise areas: {levels}."))
+    if content.focus_areas:
+        docs.append(Document("skills:focus", "Areas of expertise", f"Hafsa's expertise: {', '.join(content.focus_areas)}."))
+    for group in content.core_skills:
+        docs.append(Document(f"skills:{group.category}", f"Core skills: {group.category}", f"{group.category}: {group.text}."))
+    return docs
+
+
+def page_documents(content: Content) -> list:
+    """Documents for the prose the pages show (core/render.py), with the markup stripped."""
+    pages = (("hero", hero_html()), ("profile", profile_header_html("")), ("summary", summary_html(content)))
+    docs = []
+    for name, html in pages:
+        text = " ".join(unescape(_TAG.sub(" ", html)).split())
+        # Split into sentences so each one can be retrieved on its own
+        for i, chunk in enumerate(re.split(r"(?<=[.!?])\s+(?=[A-Z])", text)):
+            if len(chunk) > 30:
+                docs.append(Document(f"{name}:{i}", f"About ({name})", chunk))
+    return docs
+
+
+def extract_corpus(content: Content) -> list:
+    """Documents describing the portfolio: the shared data plus the page prose."""
+    return content_documents(content) + page_documents(content)
+
+
+class BM25Index:
+    """Okapi BM25 over a small in-memory corpus."""
+
+    def __init__(self, documents, k1=1.5, b=0.75):
+        self.documents = list(documents)
+        self.k1 = k1
+        self.b = b
+        self.term_freqs = [Counter(tokenize(f"{d.title} {d.text}")) for d in self.documents]
+        self.lengths = [sum(tf.values()) for tf in self.term_freqs]
+        self.avg_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+        doc_freq = Counter(term for tf in self.term_freqs for term in tf)
+        n = len(self.documents)
+        self.idf = {term: math.log(1 + (n - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()}
+
+    def search(self, query: str, k: int = TOP_K) -> list:
+        terms = [t for t in tokenize(query) if t in self.idf]
+        if not terms:
+            return []
+        scored = []
+        for doc, tf, length in zip(self.documents, self.term_freqs, self.lengths):
+            score = 0.0
+            for term in terms:
+                freq = tf.get(term)
+                if freq:
+                    norm = freq + self.k1 * (1 - self.b + self.b * length / self.avg_length)
+                    score += self.idf[term] * freq * (self.k1 + 1) / norm
+            if score > 0:
+                scored.append((score, doc))
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return [doc for _, doc in scored[:k]]
+
+
+_index = {"content": None, "index": None, "version": None}
+_lock = threading.Lock()
+
+
+def _current():
+    # get_content() keeps the same object until the data file really changes
+    content = get_content()
+    with _lock:
+        if _index["content"] is not content:
+            docs = extract_corpus(content)
+            digest = hashlib.sha256("\n".join(f"{d.id}\t{d.text}" for d in docs).encode())
+            _index.update(content=content, index=BM25Index(docs), version=digest.hexdigest()[:12])
+        return _index["index"], _index["version"]
+
+
+def get_index() -> BM25Index:
+    """Process-wide index, rebuilt only when the content changes."""
+    return _current()[0]
+
+
+def corpus_version() -> str:
+    """Short hash of the indexed documents, for cache keys."""
+    return _current()[1]
+
+
+def augment_prompt(user_input: str, k: int = TOP_K) -> str:
+    """The question prefixed with the k most relevant portfolio snippets (if any)."""
+    if not RAG_ENABLED:
+        return user_input
+    docs = get_index().search(user_input, k)
+    if not docs:
+        return user_input
+    context = "\n".join(f"- {doc.text}" for doc in docs)
+    return (
+        "Relevant facts from Hafsa Kamali's portfolio (use them if they help, "
+        "and do not invent details beyond them):\n"
+        f"{context}\n\nQuestion: {user_input}"
+    )
@@ -0,0 +1,315 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Each visitor's chat (transcript, model memory, rendered HTML) is kept here
+# rather than in st.session_state, so the registry can account for it and
+# move it out of memory without reaching into another session's state. A
+# chat is evicted once its session has closed, after CHATBOT_STATE_TTL idle
+# seconds, and sooner (least recently used first) while the total is over
+# CHATBOT_STATE_BUDGET bytes. Chats of open sessions are spilled to disk
+# ("sqlite" or "jsonl") and put back when the visitor returns, or dropped
+# ("none"). The key is the session's own id, which dies with the session,
+# so chats of closed sessions are dropped rather than spilled, spilled chats
+# are deleted once their session closes, and a new process starts with an
+# empty store.
+STATE_BUDGET = int(os.getenv("CHATBOT_STATE_BUDGET", 64 * 1024 * 1024))
+STATE_TTL = float(os.getenv("CHATBOT_STATE_TTL", 30 * 60))
+# Never evict a session for the budget sooner than this after its last run
+STATE_MIN_IDLE = float(os.getenv("CHATBOT_STATE_MIN_IDLE", 120))
+STATE_SPILL = os.getenv("CHATBOT_STATE_SPILL", "sqlite")
+STATE_PATH = Path(os.getenv(
+    "CHATBOT_STATE_PATH", Path(__file__).parent.parent.absolute() / ".cache" / "sessions"
+))
+# Spilled chats are deleted after this many seconds even if their session is
+# still open (a backstop; they are normally deleted when it closes)
+STATE_RETAIN = float(os.getenv("CHATBOT_STATE_RETAIN", 24 * 60 * 60))
+
+# Rough per-object costs of a message dict and of an assistant with empty memory
+MESSAGE_OVERHEAD = 400
+ASSISTANT_OVERHEAD = 2048
+
+
+def estimate_bytes(chat) -> int:
+    """Estimated memory held by one chat (see pages/chatbot.py, core/transcript.py)."""
+    size = 0
+    for message in chat.get("messages", ()):
+        size += MESSAGE_OVERHEAD + len(message.get("content", "").encode("utf-8"))
+    size += sum(len(html) for html in chat.get("transcript_html", {}).values())
+    block = chat.get("transcript_block")
+    if block:
+        size += len(block["html"]) + 40 * len(block["ids"])
+    assistant = chat.get("assistant")
+    if assistant is not None:
+        memory = assistant.chatbot.memory
+        size += ASSISTANT_OVERHEAD + len(memory.summary) + sum(len(u) + len(a) for u, a in memory.turns)
+    return size
+
+
+@dataclass
+class Snapshot:
+    """The part of a chat worth keeping: the transcript and the model's memory."""
+    messages: list
+    memory: dict = field(default_factory=dict)
+
+    @classmethod
+    def of(cls, chat):
+        assistant = chat.get("assistant")
+        memory = assistant.chatbot.memory.snapshot() if assistant is not None else chat.get("memory", {})
+        return cls(list(chat.get("messages", ())), memory)
+
+
+class SQLiteStore:
+    """Spilled chats in one table, keyed by session id."""
+
+    def __init__(self, path, retain=STATE_RETAIN):
+        self.path = Path(path)
+        self.retain = retain
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (session_id TEXT PRIMARY KEY, data TEXT NOT NULL, saved_at REAL NOT NULL)"
+        )
+
+    def save(self, session_id, snapshot):
+        data = json.dumps({"messages": snapshot.messages, "memory": snapshot.memory})
+        with self._lock:
+            now = time.time()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, data, saved_at) VALUES (?, ?, ?)",
+                (session_id, data, now),
+            )
+            self._conn.execute("DELETE FROM sessions WHERE saved_at <= ?", (now - self.retain,))
+
+    def pop(self, session_id):
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        data = json.loads(row[0])
+        return Snapshot(data["messages"], data["memory"])
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions")
+
+
+class JSONLStore:
+    """Spilled chats as one file per session: the memory, then one message per line."""
+
+    def __init__(self, directory, retain=STATE_RETAIN):
+        self.directory = Path(directory)
+        self.retain = retain
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, session_id):
+        # Session ids are uuid4 hex strings; anything else cannot become a path
+        if not session_id.isalnum():
+            raise ValueError(f"invalid session id: {session_id!r}")
+        return self.directory / f"{session_id}.jsonl"
+
+    def save(self, session_id, snapshot):
+        lines = [json.dumps(snapshot.memory)] + [json.dumps(message) for message in snapshot.messages]
+        self._path(session_id).write_text("\n".join(lines) + "\n", encoding="utf-8")
+        cutoff = time.time() - self.retain
+        for path in self.directory.glob("*.jsonl"):
+            if path.stat().st_mtime <= cutoff:
+                path.unlink(missing_ok=True)
+
+    def pop(self, session_id):
+        path = self._path(session_id)
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return None
+        path.unlink(missing_ok=True)
+        return Snapshot([json.loads(line) for line in lines[1:]], json.loads(lines[0]))
+
+    def clear(self):
+        for path in self.directory.glob("*.jsonl"):
+            path.unlink(missing_ok=True)
+
+
+def make_store(kind=STATE_SPILL, path=STATE_PATH):
+    """Spill store for ``kind``, or None to drop evicted chats."""
+    if kind == "sqlite":
+        return SQLiteStore(Path(path).with_suffix(".sqlite3"))
+    if kind == "jsonl":
+        return JSONLStore(path)
+    return None
+
+
+def session_alive(runtime_id) -> bool:
+    """Whether Streamlit still has the session connected (always True outside a server)."""
+    if runtime_id is None or not Runtime.exists():
+        return True
+    return Runtime.instance().is_active_session(runtime_id)
+
+
+@dataclass
+class _Entry:
+    chat: dict
+    runtime_id: str
+    last_seen: float
+    bytes: int = 0
+    running: int = 0
+
+
+class SessionRegistry:
+    """Owns every session's chat and keeps the total under a byte budget.
+
+    ``chat(key)`` hands a session its chat dict for the length of a script
+    run; a chat is only evicted while no run is using it, so eviction never
+    races the page. Chats of sessions Streamlit has closed are dropped on the
+    next sweep, as are spilled chats whose session has closed since (nobody
+    can ask for them again), and every sweep runs at the end of some session's chat run,
+    so no background thread is needed.
+    """
+
+    def __init__(self, store=None, budget_bytes=STATE_BUDGET, ttl=STATE_TTL, min_idle=STATE_MIN_IDLE,
+                 clock=time.monotonic, alive=session_alive):
+        self.store = store
+        self.budget_bytes = budget_bytes
+        self.ttl = ttl
+        self.min_idle = min_idle
+        self.clock = clock
+        self.alive = alive
+        self._entries = {}
+        # Spilled chat key -> runtime session id, to delete them once it closes
+        self._spilled = {}
+        self._lock = threading.Lock()
+        self.closed = 0
+        self.expired = 0
+        self.evicted_for_budget = 0
+        self.rehydrated = 0
+        self.pruned = 0
+
+    def open(self, key, runtime_id=None) -> dict:
+        """The chat for ``key``, rehydrated from the spill store if it was evicted.
+
+        A rehydrated chat holds "messages" and "memory" (a ConversationMemory
+        snapshot); everything else is rebuilt by the page.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                chat = {}
+                snapshot = None
+                if key in self._spilled:
+                    del self._spilled[key]
+                    snapshot = self.store.pop(key)
+                if snapshot is not None:
+                    chat.update(messages=snapshot.messages, memory=snapshot.memory)
+                    self.rehydrated += 1
+                entry = self._entries[key] = _Entry(chat, runtime_id, self.clock())
+            entry.running += 1
+            entry.last_seen = self.clock()
+            if runtime_id is not None:
+                entry.runtime_id = runtime_id
+            return entry.chat
+
+    def release(self, key):
+        """Record the chat's current size, then evict other chats as needed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.running -= 1
+                entry.bytes = estimate_bytes(entry.chat)
+                entry.last_seen = self.clock()
+        self.sweep(exclude=key)
+
+    @contextmanager
+    def chat(self, key):
+        """``open`` for the current script run, released when the run is done with it."""
+        ctx = get_script_run_ctx(suppress_warning=True)
+        chat = self.open(key, ctx.session_id if ctx is not None else None)
+        try:
+            yield chat
+        finally:
+            self.release(key)
+
+    def _evict(self, key, spill=True):
+        entry = self._entries.pop(key)
+        if spill and self.store is not None:
+            self.store.save(key, Snapshot.of(entry.chat))
+            self._spilled[key] = entry.runtime_id
+
+    def sweep(self, exclude=None):
+        """Evict idle chats: closed sessions, then past the TTL, then least recently seen while over budget.
+
+        Only chats of open sessions are spilled; closed sessions are dropped and
+        their spilled chats deleted from the store.
+
+        ``exclude`` is the chat whose run just ended; its visitor is still on the page.
+        """
+        with self._lock:
+            now = self.clock()
+            for key, entry in list(self._entries.items()):
+                if entry.running or key == exclude:
+                    continue
+                if not self.alive(entry.runtime_id):
+                    self._evict(key, spill=False)
+                    self.closed += 1
+                elif now - entry.last_seen >= self.ttl:
+                    self._evict(key)
+                    self.expired += 1
+            for key, runtime_id in list(self._spilled.items()):
+                if not self.alive(runtime_id):
+                    del self._spilled[key]
+                    self.store.pop(key)
+                    self.pruned += 1
+            total = sum(entry.bytes for entry in self._entries.values())
+            if total <= self.budget_bytes:
+                return
+            idle = sorted(
+                (entry.last_seen, key) for key, entry in self._entries.items()
+                if not entry.running and key != exclude and now - entry.last_seen >= self.min_idle
+            )
+            for _, key in idle:
+                if total <= self.budget_bytes:
+                    break
+                total -= self._entries[key].bytes
+                self._evict(key)
+                self.evicted_for_budget += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            sizes = [entry.bytes for entry in self._entries.values()]
+            return {
+                "resident": len(sizes),
+                "bytes": sum(sizes),
+                "largest_bytes": max(sizes, default=0),
+                "budget_bytes": self.budget_bytes,
+                "closed": self.closed,
+                "expired": self.expired,
+                "evicted_for_budget": self.evicted_for_budget,
+                "rehydrated": self.rehydrated,
+                "spilled": len(self._spilled),
+                "pruned": self.pruned,
+                "spill": type(self.store).__name__ if self.store is not None else "none",
+            }
+
+
+@lru_cache(maxsize=None)
+def get_session_registry():
+    """Process-wide registry configured from the environment.
+
+    Chats spilled by an earlier process belong to sessions that died with it,
+    so the store starts empty.
+    """
+    store = make_store()
+    if store is not None:
+        store.clear()
+    return SessionRegistry(store)
@@ -0,0 +1,72 @@
+import hashlib
+import mimetypes
+import os
+import shutil
+import threading
+from pathlib import Path
+
+from core.assets import asset_cache
+
+# Hash-versioned copies of assets live here. Streamlit serves this folder at
+# app/static/ when server.enableStaticServing is on (see .streamlit/config.toml).
+STATIC_DIR = Path(__file__).parent.parent.absolute() / "static"
+
+# Prefix for published URLs. Point it at `python -m core.asset_server` or a CDN
+# to get long-lived immutable cache headers.
+ASSET_BASE_URL = os.getenv("PORTFOLIO_ASSET_BASE_URL", "app/static").rstrip("/")
+
+# Set to 0 to fall back to inline data: URIs (e.g. when static serving is off)
+STATIC_SERVING = os.getenv("PORTFOLIO_STATIC_SERVING", "1") != "0"
+
+_published = {}
+_lock = threading.Lock()
+
+
+def content_hash(path) -> str:
+    """Short SHA-256 digest of a file's contents, served from the asset cache."""
+    return hashlib.sha256(asset_cache.read_bytes(path)).hexdigest()[:12]
+
+
+def publish(path) -> str:
+    """Copy ``path`` into STATIC_DIR under a content-hashed name and return that name.
+
+    The result is memoized per path + mtime + size, so repeated calls cost a
+    single stat.
+    """
+    path = Path(path).absolute()
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        name = _published.get(key)
+    if name is not None:
+        return name
+
+    name = f"{path.stem}.{content_hash(path)}{path.suffix.lower()}"
+    target = STATIC_DIR / name
+    if not target.exists():
+        STATIC_DIR.mkdir(exist_ok=True)
+        tmp = target.with_name(f".{name}.{os.getpid()}.tmp")
+        shutil.copyfile(path, tmp)
+        os.replace(tmp, target)
+    with _lock:
+        _published[key] = name
+    return name
+
+
+def data_uri(path) -> str:
+    mime = mimetypes.guess_type(str(path))[0] or "application/octet-stream"
+    return f"data:{mime};base64,{asset_cache.get_base64(path)}"
+
+
+def asset_url(path):
+    """Stable URL for an asset, or None if the file does not exist.
+
+    Returns a hash-versioned static URL, or an inline data: URI when static
+    serving is disabled.
+    """
+    path = Path(path).absolute()
+    if not path.exists():
+        return None
+    if not STATIC_SERVING:
+        return data_uri(path)
+    return f"{ASSET_BASE_URL}/{publish(path)}"
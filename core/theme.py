@@ -0,0 +1,364 @@
+import os
+import re
+from functools import lru_cache
+
+# One stylesheet per page: the shared rules plus the page's own, minified once
+# per process and injected as a single <style> block. Used by the Streamlit
+# pages and the static export (core/export.py).
+
+# Start every session in reduced-motion mode (visitors can still switch it off)
+REDUCED_MOTION = os.getenv("PORTFOLIO_REDUCED_MOTION", "0") == "1"
+
+BASE_CSS = """
+@keyframes float {
+    0%, 100% { transform: translateY(0px); }
+    50% { transform: translateY(-10px); }
+}
+@keyframes pulse {
+    0% { transform: scale(1); }
+    50% { transform: scale(1.03); }
+    100% { transform: scale(1); }
+}
+.stApp {
+    background-size: cover;
+    background-position: center;
+    background-attachment: fixed;
+}
+/* Purple-pink gradient text used for names and highlights */
+.main-heading, .sub-heading, .profile-name {
+    background: linear-gradient(90deg, #8b5cf6, #ec4899, #8b5cf6);
+    -webkit-background-clip: text;
+    background-clip: text;
+    color: transparent;
+    font-weight: bold;
+    text-shadow:
+        0 2px 4px rgba(0, 0, 0, 0.2), /* Soft drop shadow */
+        0 0 10px rgba(139, 92, 246, 0.4); /* Neon glow */
+}
+"""
+
+MAIN_CSS = """
+/* The background lives on a fixed layer behind the content, which the
+   browser composites once instead of repainting it (as it does for
+   background-attachment: fixed) on every scroll. The layer itself never
+   moves; only a new image fades in (not in reduced-motion mode). */
+.stApp {
+    isolation: isolate;
+}
+.stApp::before {
+    content: "";
+    position: fixed;
+    inset: 0;
+    z-index: -1;
+    background-size: cover;
+    background-position: center;
+    background-repeat: no-repeat;
+    transition: background-image 1s ease-in-out;
+}
+.custom-profile-image {
+    border-radius: 50% !important;
+    border: 4px solid white !important;
+    transition: all 0.5s ease !important;
+    animation: float 2s ease-in-out infinite !important;
+    will-change: transform;
+    object-fit: cover;
+    max-width: 300px !important;
+    max-height: 300px !important;
+    margin-top: 40px !important;
+}
+.nav-link {
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    justify-content: center;
+    text-align: center;
+    padding: 15px;
+    background-color: rgba(255,255,255,0.1);
+    border-radius: 10px;
+    transition: all 0.3s ease;
+    margin-bottom: 10px;
+    margin-top: 10px;
+}
+.nav-link:hover {
+    background-color: rgba(255,255,255,0.2);
+    transform: scale(1.05);
+}
+.main-heading { font-size: 1.5em; }
+.sub-heading { font-size: 1em; }
+"""
+
+DASHBOARD_CSS = """
+.stApp {
+    background-color: #0A192F;  /* Default dark background color */
+    color: white;
+}
+.profile-img-container {
+    position: relative;
+    width: 300px;
+    height: 300px;
+    margin: 0 auto;
+}
+.profile-img-container picture {
+    display: contents;
+}
+.profile-img {
+    width: 100%;
+    height: 100%;
+    object-fit: cover;
+    border-radius: 50%;
+    border: 4px solid #64FFDA;
+    box-shadow: 0 0 20px rgba(100, 255, 218, 0.4);
+    animation: float 6s ease-in-out infinite;
+    will-change: transform;
+}
+.gradient-text {
+    background: linear-gradient(90deg, #64FFDA, #8892B0);
+    -webkit-background-clip: text;
+    background-clip: text;
+    color: transparent;
+}
+"""
+
+PROJECTS_CSS = """
+.stApp {
+    background-color: #0A192F;
+    color: white;
+}
+.profile-img {
+    width: 250px;
+    height: 250px;
+    object-fit: cover;
+    border-radius: 50%;
+    border: 5px solid #64FFDA;
+    box-shadow: 0 0 30px rgba(100, 255, 218, 0.4);
+    display: block;
+    margin: 0 auto 20px;
+}
+.profile-name {
+    text-align: center;
+    font-size: 3em;
+    margin-bottom: 30px;
+    text-shadow:
+        0 2px 4px rgba(0, 0, 0, 0.4), /* Soft drop shadow */
+        0 0 10px rgba(139, 92, 246, 0.4); /* Neon glow */
+}
+.profile-bio {
+    text-align: center;
+    max-width: 900px;
+    margin: 0 auto 40px;
+    color: #8892B0;
+    line-height: 1.6;
+}
+.project-card {
+    background-color: rgba(17, 34, 64, 0.7);
+    border-radius: 15px;
+    padding: 35px;
+    margin-bottom: 20px;
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+    height: 100%;
+    width: 100%;
+}
+.project-card:hover {
+    transform: scale(1.03);
+    box-shadow: 0 10px 20px rgba(100, 255, 218, 0.2);
+}
+.tech-badge {
+    background-color: rgba(100, 255, 218, 0.1);
+    color: #64FFDA;
+    padding: 5px 10px;
+    border-radius: 20px;
+    margin-right: 10px;
+    margin-bottom: 10px;
+    display: inline-block;
+}
+"""
+
+ABOUT_CSS = """
+.profile-image {
+    border-radius: 50%;
+    border: 4px solid #8b5cf6;
+    box-shadow: 0 4px 20px rgba(139, 92, 246, 0.3);
+    transition: all 0.3s ease;
+    width: 300px;
+    height: 300px;
+    object-fit: cover;
+    animation: pulse 3s ease-in-out infinite;
+    will-change: transform;
+}
+.profile-image:hover {
+    transform: scale(1.03);
+    box-shadow: 0 8px 25px rgba(139, 92, 246, 0.5);
+    animation-play-state: paused;
+}
+.about-container {
+    background-color: rgba(0,0,0,0.7);
+    border-radius: 15px;
+    padding: 2.5rem;
+    color: white;
+    backdrop-filter: blur(10px);
+}
+.main-heading { font-size: 2em; }
+/* Contact Form Styling */
+.stForm {
+    background-color: rgba(255, 255, 255, 0.1) !important;
+    border-radius: 10px !important;
+    padding: 20px !important;
+    border: 2px solid transparent !important;
+    background-clip: padding-box !important;
+    position: relative !important;
+}
+.stForm::before {
+    content: "";
+    position: absolute;
+    top: -2px;
+    left: -2px;
+    right: -2px;
+    bottom: -2px;
+    z-index: -1;
+    border-radius: 12px;
+    background: linear-gradient(90deg, #8b5cf6, #ec4899, #8b5cf6);
+}
+.stTextInput>div>div>input,
+.stTextArea>div>textarea {
+    background-color: rgba(255, 255, 255, 0.1) !important;
+    color: white !important;
+    border: 1px solid rgba(255, 255, 255, 0.2) !important;
+}
+.stTextInput>label,
+.stTextArea>label,
+.stMarkdown>div>div>h2 {
+    color: white !important;
+}
+.stForm button {
+    background: linear-gradient(90deg, #8b5cf6, #ec4899) !important;
+    color: white !important;
+    border: none !important;
+    border-radius: 5px !important;
+    padding: 8px 16px !important;
+    transition: all 0.3s ease !important;
+}
+.stForm button:hover {
+    transform: scale(1.02) !important;
+    box-shadow: 0 0 10px rgba(139, 92, 246, 0.5) !important;
+}
+"""
+
+CHATBOT_CSS = """
+.stApp {
+    color: white;
+}
+.profile-img {
+    width: 150px;
+    height: 150px;
+    object-fit: cover;
+    border-radius: 50%;
+    border: 3px solid #64FFDA;
+    box-shadow: 0 0 15px rgba(100, 255, 218, 0.6);
+    animation: float 6s ease-in-out infinite;
+    will-change: transform;
+}
+.user-message {
+    background-color: rgba(100, 255, 218, 0.2);
+    border-radius: 10px;
+    padding: 10px 15px;
+    margin: 10px 0;
+    border-left: 3px solid #64FFDA;
+}
+.assistant-message {
+    background-color: rgba(139, 92, 246, 0.2);
+    border-radius: 10px;
+    padding: 10px 15px;
+    margin: 10px 0;
+    border-left: 3px solid #8b5cf6;
+}
+.gradient-text {
+    background: linear-gradient(90deg, #64FFDA, #8b5cf6);
+    -webkit-background-clip: text;
+    background-clip: text;
+    color: transparent;
+    font-weight: bold;
+}
+"""
+
+PAGE_CSS = {
+    "main": MAIN_CSS,
+    "dashboard": DASHBOARD_CSS,
+    "projects": PROJECTS_CSS,
+    "about": ABOUT_CSS,
+    "chatbot": CHATBOT_CSS,
+}
+
+# Element that carries each page's background image (default ".stApp")
+BACKGROUND_SELECTORS = {"main": ".stApp::before"}
+
+# Used when a page's background image is missing
+FALLBACK_BACKGROUNDS = {
+    "main": ".stApp::before { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }",
+    "about": ".stApp { background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); }",
+}
+
+# Stops every animation and transition. Appended last so it beats the
+# !important page rules of equal specificity.
+STILL_CSS = """
+.stApp, .stApp::before, .stApp *, .stApp *::before, .stApp *::after {
+    animation: none !important;
+    transition: none !important;
+}
+"""
+
+# Honour the operating system setting even when the toggle is off
+REDUCED_MOTION_CSS = f"@media (prefers-reduced-motion: reduce) {{ {STILL_CSS} }}"
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_SPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"\s*([{}:;,>])\s*")
+
+
+def minify(css: str) -> str:
+    """Drop comments and redundant whitespace. Good enough for hand-written CSS."""
+    css = _COMMENT.sub("", css)
+    css = _SPACE.sub(" ", css)
+    css = _PUNCTUATION.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+@lru_cache(maxsize=None)
+def stylesheet(page: str, reduced_motion: bool = False) -> str:
+    """Minified shared + page CSS, built once per process and motion mode."""
+    return minify(BASE_CSS + PAGE_CSS[page] + (STILL_CSS if reduced_motion else REDUCED_MOTION_CSS))
+
+
+def background_selector(page: str) -> str:
+    return BACKGROUND_SELECTORS.get(page, ".stApp")
+
+
+def style_tag(page: str, background=None, reduced_motion: bool = False) -> str:
+    """The page's single <style> block, followed by its background rules.
+
+    ``background`` is the output of core.responsive.background_css for
+    background_selector(page) (already compact and memoized); without it the
+    page's fallback, if any, is used. ``reduced_motion`` turns off every
+    animation; otherwise they only stop for visitors whose system asks for
+    reduced motion.
+    """
+    background = background or FALLBACK_BACKGROUNDS.get(page, "")
+    return f"<style>{stylesheet(page, reduced_motion)}{background}</style>"
+
+
+def motion_toggle(state, sidebar) -> bool:
+    """Sidebar switch for reduced-motion mode; returns whether it is on.
+
+    The choice is kept in ``state`` (normally ``st.session_state``) under a
+    plain key, so it survives moving between pages, where Streamlit would
+    drop the widget's own state.
+    """
+    state.setdefault("reduced_motion", REDUCED_MOTION)
+
+    def changed():
+        state["reduced_motion"] = state["reduced_motion_toggle"]
+
+    sidebar.toggle(
+        "Reduce motion", value=state["reduced_motion"], key="reduced_motion_toggle", on_change=changed,
+        help="Stop background and image animations to save battery and CPU on slower devices.",
+    )
+    return state["reduced_motion"]
@@ -0,0 +1,83 @@
+import os
+import uuid
+
+import streamlit as st
+
+# Messages shown at once; older ones sit behind a "show earlier messages" button
+PAGE_SIZE = int(os.getenv("CHATBOT_TRANSCRIPT_PAGE", 20))
+
+ROLE_TEMPLATES = {
+    "user": '<div class="user-message">👻<strong>You:</strong> {content}</div>',
+    "assistant": '<div class="assistant-message">🐱‍👓<strong>Assistant:</strong> {content}</div>',
+}
+
+
+def new_message(role: str, content: str) -> dict:
+    """Transcript entry with a stable id used to cache its rendered HTML."""
+    return {"id": uuid.uuid4().hex, "role": role, "content": content}
+
+
+def render_message_html(message: dict) -> str:
+    template = ROLE_TEMPLATES.get(message["role"], ROLE_TEMPLATES["assistant"])
+    return template.format(content=message["content"])
+
+
+class TranscriptRenderer:
+    """Renders the chat history as one cached HTML block per rerun.
+
+    Each message's HTML is built once and kept in session state by message
+    id; the joined block for the visible window is extended in place when
+    new messages arrive. Only the newest ``page_size`` messages are shown
+    until the visitor asks for earlier ones, so rerun cost stays flat as the
+    conversation grows.
+    """
+
+    def __init__(self, state, page_size=PAGE_SIZE, key="transcript"):
+        self.state = state
+        self.page_size = page_size
+        self.key = key
+        self.html = state.setdefault(f"{key}_html", {})
+        if f"{key}_visible" not in state:
+            state[f"{key}_visible"] = page_size
+
+    @property
+    def visible(self) -> int:
+        return self.state[f"{self.key}_visible"]
+
+    def _message_html(self, message):
+        if "id" not in message:
+            message["id"] = uuid.uuid4().hex
+        html = self.html.get(message["id"])
+        if html is None:
+            html = self.html[message["id"]] = render_message_html(message)
+        return html
+
+    def _block(self, window):
+        """Joined HTML for ``window``, extending the previous block when possible."""
+        for message in window:
+            self._message_html(message)
+        ids = [message["id"] for message in window]
+        cached = self.state.get(f"{self.key}_block")
+        if cached and cached["ids"] == ids[: len(cached["ids"])]:
+            new_ids = ids[len(cached["ids"]):]
+            if not new_ids:
+                return cached["html"]
+            html = "\n\n".join([cached["html"]] + [self.html[i] for i in new_ids])
+        else:
+            html = "\n\n".join(self.html[i] for i in ids)
+        self.state[f"{self.key}_block"] = {"ids": ids, "html": html}
+        return html
+
+    def render(self, messages):
+        hidden = len(messages) - self.visible
+        if hidden > 0 and st.button("Show earlier messages", key=f"{self.key}_show_earlier"):
+            self.state[f"{self.key}_visible"] += self.page_size
+            hidden = len(messages) - self.visible
+
+        window = messages[max(hidden, 0):]
+        if window:
+            st.markdown(self._block(window), unsafe_allow_html=True)
+
+    def render_new(self, message):
+        """Render a message appended during this run, without a rerun."""
+        st.markdown(self._message_html(message), unsafe_allow_html=True)
@@ -0,0 +1,53 @@
+import json
+import threading
+from pathlib import Path
+
+# Output of `python -m core.optimize`; see that module for the manifest layout
+OPTIMIZED_DIR = Path(__file__).parent.parent.absolute() / "assets" / "optimized"
+MANIFEST_PATH = OPTIMIZED_DIR / "manifest.json"
+# Bumped when variant naming changes; older manifests are ignored and rebuilt
+MANIFEST_VERSION = 2
+
+_manifest = {"key": None, "data": {}}
+_lock = threading.Lock()
+
+
+def load_manifest() -> dict:
+    """Parsed manifest, reloaded only when the file changes. Empty if missing or outdated."""
+    try:
+        stat = MANIFEST_PATH.stat()
+    except FileNotFoundError:
+        return {}
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        if _manifest["key"] != key:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                data = json.load(f)
+            _manifest["data"] = data if data.get("version") == MANIFEST_VERSION else {}
+            _manifest["key"] = key
+        return _manifest["data"]
+
+
+def get_variants(source) -> list:
+    """Up-to-date variants for a source image, or [] if none were built.
+
+    Variants built from an older version of the source (different size or
+    mtime) are ignored so a stale optimization never hides a new image.
+    """
+    source = Path(source).absolute()
+    entry = load_manifest().get("assets", {}).get(source.name)
+    if not entry:
+        return []
+    try:
+        stat = source.stat()
+    except FileNotFoundError:
+        return []
+    if entry.get("source_size") != stat.st_size or entry.get("source_mtime_ns") != stat.st_mtime_ns:
+        return []
+    variants = []
+    for variant in entry.get("variants", []):
+        path = OPTIMIZED_DIR / variant["file"]
+        if path.exists():
+            variants.append(dict(variant, path=path))
+    return variants
+
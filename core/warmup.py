@@ -0,0 +1,178 @@
+"""Fill the process-wide caches before visitors need them.
+
+    python -m core.warmup            # run every step and print its timing
+
+Each step loads one shared resource: the asset manifest, the content file,
+page stylesheets, published images and their markup, dashboard figures, the
+retrieval index, the response cache and the chat provider.
+
+Run as a command, this is a separate process: it checks that every step
+works and publishes every image to static/ (files the server then reuses),
+but it cannot fill a running server's in-memory caches. Inside the app,
+each page calls ``start()``; the first call in a server process runs the
+steps on a background thread. Pages wait for the steps every page needs
+instead of building the same things in parallel, but never past
+PORTFOLIO_WARMUP_WAIT seconds after the warm-up started, so a stuck step
+delays only the first runs. The rest finish in the background, and
+``?debug=1`` shows the progress in the perf panel.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+# Set to 0 to skip the background warm-up in the app
+WARMUP_ENABLED = os.getenv("PORTFOLIO_WARMUP", "1") != "0"
+# Longest a page waits for SHARED_STEPS before building what it needs itself
+WARMUP_WAIT = float(os.getenv("PORTFOLIO_WARMUP_WAIT", 10))
+
+
+@dataclass
+class StepResult:
+    name: str
+    seconds: float
+    error: str = None
+
+
+def _asset_manifest():
+    from core.resolver import resolver
+    resolver.files()
+
+
+def _content():
+    from core.content import get_content
+    get_content()
+
+
+def _stylesheets():
+    from core.theme import PAGE_CSS, stylesheet
+    for page in PAGE_CSS:
+        for reduced_motion in (False, True):
+            stylesheet(page, reduced_motion)
+
+
+def _images():
+    from core.render import PAGE_IMAGES, find_background, find_profile, page_background, profile_picture
+    for page in PAGE_IMAGES:
+        background = find_background(page)
+        if background:
+            page_background(page, background)
+        profile = find_profile(page)
+        if profile:
+            profile_picture(page, profile)
+
+
+def _figures():
+    from core.content import get_content
+    from core.figures import expertise_radar, language_figure, tools_styler
+    content = get_content()
+    language_figure(content.languages)
+    tools_styler(content.tools)
+    expertise_radar(content.expertise)
+
+
+def _retrieval():
+    from core.retrieval import get_index
+    get_index()
+
+
+def _response_cache():
+    from core.response_cache import get_response_cache
+    get_response_cache()
+
+
+def _provider():
+    from core.providers import get_provider
+    get_provider()
+
+
+# What every page renders first; the rest is only needed by some pages
+SHARED_STEPS = (
+    ("asset manifest", _asset_manifest),
+    ("content", _content),
+    ("stylesheets", _stylesheets),
+    ("images", _images),
+)
+STEPS = SHARED_STEPS + (
+    ("figures", _figures),
+    ("retrieval index", _retrieval),
+    ("response cache", _response_cache),
+    ("chat provider", _provider),
+)
+
+
+def warm_up(steps=STEPS) -> list:
+    """Run each step, timing it; a failing step is recorded and the rest still run."""
+    results = []
+    for name, step in steps:
+        started = time.perf_counter()
+        try:
+            step()
+            error = None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        results.append(StepResult(name, time.perf_counter() - started, error))
+    return results
+
+
+_state = {"thread": None, "results": [], "finished_at": None, "deadline": None}
+_lock = threading.Lock()
+_shared_ready = threading.Event()
+
+
+def _run():
+    try:
+        for index, step in enumerate(STEPS):
+            result, = warm_up([step])
+            with _lock:
+                _state["results"].append(result)
+            if index == len(SHARED_STEPS) - 1:
+                _shared_ready.set()
+    finally:
+        _shared_ready.set()
+        with _lock:
+            _state["finished_at"] = time.time()
+
+
+def start(timeout=WARMUP_WAIT) -> bool:
+    """Start the background warm-up once per process and wait for its shared steps.
+
+    Returns True if the warm-up ran or is running. Every caller waits until
+    the same deadline, ``timeout`` seconds after the warm-up started; once it
+    has passed, pages stop waiting and build what they need themselves.
+    """
+    if not WARMUP_ENABLED:
+        return False
+    with _lock:
+        if _state["thread"] is None:
+            _state["deadline"] = time.monotonic() + timeout
+            _state["thread"] = threading.Thread(target=_run, name="warmup", daemon=True)
+            _state["thread"].start()
+        remaining = _state["deadline"] - time.monotonic()
+    if remaining > 0:
+        _shared_ready.wait(remaining)
+    return True
+
+
+def is_ready() -> bool:
+    """Whether every step has finished."""
+    with _lock:
+        return _state["finished_at"] is not None
+
+
+def report():
+    """Results of the steps finished so far, or None if the warm-up never started."""
+    with _lock:
+        return list(_state["results"]) if _state["thread"] is not None else None
+
+
+if __name__ == "__main__":
+    total = 0.0
+    failed = False
+    for result in warm_up():
+        total += result.seconds
+        failed = failed or result.error is not None
+        status = f"FAILED ({result.error})" if result.error else "ok"
+        print(f"{result.name:<16} {result.seconds * 1000:8.1f} ms  {status}")
+    print(f"{'total':<16} {total * 1000:8.1f} ms")
+    raise SystemExit(1 if failed else 0)
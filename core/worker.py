@@ -0,0 +1,193 @@
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Upstream calls run on this pool so a slow model never pins a script thread
+# for longer than the request deadline.
+WORKERS = int(os.getenv("CHATBOT_WORKERS", 8))
+TIMEOUT = float(os.getenv("CHATBOT_TIMEOUT", 30))
+RETRIES = int(os.getenv("CHATBOT_RETRIES", 2))
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+POLL_INTERVAL = 0.1
+
+# Calls that may wait for a free worker. A call abandoned at its deadline
+# keeps its worker until the upstream returns, so without a bound a stuck
+# model would let the queue grow without limit; past it, new calls fail
+# fast with PoolSaturated, which is retried like a 503.
+QUEUE_LIMIT = int(os.getenv("CHATBOT_QUEUE_LIMIT", WORKERS * 2))
+
+EXECUTOR = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="chat-worker")
+_slots = threading.BoundedSemaphore(WORKERS + QUEUE_LIMIT)
+# Calls turned away because the pool was saturated (see core/perf.py)
+saturated = 0
+
+# Substrings of error names/messages worth retrying: rate limits and
+# temporary server or network failures
+TRANSIENT_MARKERS = (
+    "429", "500", "502", "503", "504",
+    "ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded", "InternalServerError",
+    "TooManyRequests", "Timeout", "temporarily", "Connection reset",
+)
+
+
+class RequestTimeout(Exception):
+    pass
+
+
+class RequestCancelled(Exception):
+    pass
+
+
+class PoolSaturated(Exception):
+    pass
+
+
+class CancelToken:
+    """Set from any thread to abandon an in-flight request."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout) -> bool:
+        return self._event.wait(timeout)
+
+
+def is_transient(exc) -> bool:
+    text = f"{type(exc).__name__} {exc}"
+    if isinstance(exc, (TimeoutError, ConnectionError, PoolSaturated)):
+        return True
+    return any(marker in text for marker in TRANSIENT_MARKERS)
+
+
+def submit(fn):
+    """``EXECUTOR.submit(fn)``, or PoolSaturated if WORKERS + QUEUE_LIMIT calls are outstanding."""
+    global saturated
+    if not _slots.acquire(blocking=False):
+        saturated += 1
+        raise PoolSaturated("all chat workers are busy")
+    future = EXECUTOR.submit(fn)
+    # Also runs when a queued call is cancelled
+    future.add_done_callback(lambda _: _slots.release())
+    return future
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, maximum=BACKOFF_MAX) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+
+def _sleep(delay, deadline, cancel):
+    delay = min(delay, max(0.0, deadline - time.monotonic()))
+    if cancel is not None and cancel.wait(delay):
+        raise RequestCancelled()
+    if cancel is None:
+        time.sleep(delay)
+
+
+def _check(deadline, cancel):
+    if cancel is not None and cancel.cancelled:
+        raise RequestCancelled()
+    if time.monotonic() >= deadline:
+        raise RequestTimeout("the model did not answer before the deadline")
+
+
+def call_with_retry(fn, timeout=TIMEOUT, retries=RETRIES, cancel=None):
+    """Run ``fn()`` on the worker pool with a deadline, retries and cancellation.
+
+    Transient failures (429, 5xx, timeouts) are retried with exponential
+    backoff while time remains. Raises RequestTimeout once ``timeout``
+    seconds have passed in total and RequestCancelled when ``cancel`` is set.
+    An abandoned call keeps running on its worker, and counts against
+    QUEUE_LIMIT, but no longer blocks the caller.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        try:
+            future = submit(fn)
+            while not future.done():
+                try:
+                    _check(deadline, cancel)
+                except (RequestTimeout, RequestCancelled):
+                    future.cancel()
+                    raise
+                wait([future], timeout=POLL_INTERVAL)
+            return future.result()
+        except (RequestTimeout, RequestCancelled):
+            raise
+        except Exception as exc:
+            if attempt >= retries or not is_transient(exc):
+                raise
+        _sleep(backoff_delay(attempt), deadline, cancel)
+        attempt += 1
+        _check(deadline, cancel)
+
+
+_DONE = object()
+
+
+def stream_with_retry(make_stream, timeout=TIMEOUT, retries=RETRIES, cancel=None):
+    """Iterate ``make_stream()`` on the worker pool, yielding chunks as they arrive.
+
+    Same retry and cancellation rules as call_with_retry, but ``timeout``
+    bounds the wait for each chunk rather than the whole answer. A failed
+    attempt is only retried if it had not produced any chunk yet, so callers
+    never see duplicated text. Closing the generator cancels the request.
+    """
+    cancel = cancel or CancelToken()
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    try:
+        while True:
+            chunks = queue.Queue()
+
+            def pump():
+                try:
+                    for chunk in make_stream():
+                        if cancel.cancelled:
+                            return
+                        chunks.put(chunk)
+                    chunks.put(_DONE)
+                except BaseException as exc:  # handed to the consumer below
+                    chunks.put(exc)
+
+            try:
+                submit(pump)
+            except PoolSaturated:
+                if attempt >= retries:
+                    raise
+                _sleep(backoff_delay(attempt), deadline, cancel)
+                attempt += 1
+                continue
+            produced = False
+            while True:
+                _check(deadline, cancel)
+                try:
+                    item = chunks.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    if produced or attempt >= retries or not is_transient(item):
+                        raise item
+                    break
+                produced = True
+                yield item
+                deadline = time.monotonic() + timeout
+            _sleep(backoff_delay(attempt), deadline, cancel)
+            attempt += 1
+    finally:
+        # Also runs on GeneratorExit, e.g. when a Streamlit rerun interrupts the stream
+        cancel.cancel()
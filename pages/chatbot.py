@@ -1,214 +1,309 @@
 import os
+import threading
+import time
+import uuid
 from dotenv import load_dotenv
 import streamlit as st
-from pathlib import Path
-import base64
-from typing import Dict, List
-import google.generativeai as genai
+from typing import Dict, Iterator, List
+
+from core import perf, warmup
+from core.render import page_images
+from core.response_cache import cache_key, get_response_cache
+from core.memory import ConversationMemory
+from core.providers import ChatProvider, get_provider
+from core.ratelimit import rate_limiter, single_flight
+from core.sessions import get_session_registry
+from core.theme import motion_toggle, style_tag
+from core.retrieval import RAG_ENABLED, augment_prompt, corpus_version
+from core.transcript import TranscriptRenderer, new_message
+from core.worker import TIMEOUT, CancelToken, RequestCancelled, call_with_retry, stream_with_retry
 
 # --- Load environment variables ---
 load_dotenv()
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
 
-# --- Gemini-based Assistant ---
-# --- Gemini-based Assistant ---
+# Render answers token by token as they arrive; set to 0 to wait for the full reply
+STREAMING = os.getenv("CHATBOT_STREAMING", "1") != "0"
+
+# --- AI Assistant ---
 class AIAssistant:
-    def __init__(self):
-        self.chatbot = GeminiChat()
-    
-    def generate_response(self, user_input: str) -> str:
-        return self.chatbot.get_response(user_input)
+    def __init__(self, provider: ChatProvider = None, memory: dict = None):
+        self.chatbot = ModelChat(provider, memory)
+        self.cache = get_response_cache()
 
-class GeminiChat:
-    def __init__(self):
-        # Use the correct model name for current API version
-        self.model = genai.GenerativeModel("gemini-2.0-flash")
-        self.chat = self.model.start_chat(history=[])
+    def generate_response(self, user_input: str, cancel: CancelToken = None) -> str:
+        context = self._context()
+        cached = self._cached(user_input, context)
+        if cached is not None:
+            return cached
+        prompt = augment_prompt(user_input)
+        try:
+            # Identical concurrent questions (same context) share one upstream request
+            response = single_flight.do(
+                cache_key(user_input, context), lambda shared: self.chatbot.get_response(prompt, shared), cancel
+            )
+        except RequestCancelled:
+            return ""
+        except Exception as e:
+            return self.chatbot.format_error(e)
+        self._remember(user_input, context, response)
+        return response
 
-    def get_response(self, user_input):
+    def stream_response(self, user_input: str, cancel: CancelToken = None) -> Iterator[str]:
+        context = self._context()
+        cached = self._cached(user_input, context)
+        if cached is not None:
+            yield cached
+            return
+        prompt = augment_prompt(user_input)
+        chunks = []
+        stream = single_flight.stream(
+            cache_key(user_input, context), lambda shared: self.chatbot.stream_response(prompt, shared), cancel
+        )
         try:
-            response = self.chat.send_message(user_input)
-            return response.text
+            for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+        except RequestCancelled:
+            # Only this visitor stopped; the page records what arrived as stopped
+            return
         except Exception as e:
-            # Enhanced error handling
-            error_msg = f"⚠️ AI Service Error: {str(e)}"
-            if "404" in str(e):
-                error_msg += "\n\nPlease check:\n1. Model availability\n2. API endpoint configuration\n3. Account permissions"
-            return error_msg
-
-# --- Image Handling ---
-def img_to_base64(img_path):
-    try:
-        img_path = Path(img_path).absolute()
-        if not img_path.exists():
+            yield self.chatbot.format_error(e)
+            return
+        self._remember(user_input, context, "".join(chunks))
+
+    def _cached(self, user_input, context):
+        if self.cache is None:
             return None
-        with open(img_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    except Exception as e:
-        st.error(f"Error loading image {img_path}: {str(e)}")
-        return None
-
-def get_assets_dir():
-    possible_locations = [
-        Path(__file__).parent.absolute() / "assets",
-        Path(__file__).parent.parent.absolute() / "assets",
-        Path.cwd().absolute() / "assets"
-    ]
-    for location in possible_locations:
-        if location.exists():
-            return location
-    assets_dir = Path(__file__).parent.absolute() / "assets"
-    assets_dir.mkdir(exist_ok=True)
-    return assets_dir
-
-assets_dir = get_assets_dir()
-
-# --- Custom CSS ---
-def get_custom_css(bg_image=None, profile_image=None):
-    bg_style = f' url("data:image/jpeg;base64,{bg_image}")'
-    
-    return f"""
-    <style>
-    .stApp {{
-        background: {bg_style};
-        background-size: cover;
-        background-attachment: fixed;
-        background-position: center;
-        color: white;
-    }}
-
-    .profile-img {{
-        width: 150px;
-        height: 150px;
-        object-fit: cover;
-        border-radius: 50%;
-        border: 3px solid #64FFDA;
-        box-shadow: 0 0 15px rgba(100, 255, 218, 0.6);
-        animation: float 6s ease-in-out infinite;
-    }}
-
-    .user-message {{
-        background-color: rgba(100, 255, 218, 0.2);
-        border-radius: 10px;
-        padding: 10px 15px;
-        margin: 10px 0;
-        border-left: 3px solid #64FFDA;
-    }}
-
-    .assistant-message {{
-        background-color: rgba(139, 92, 246, 0.2);
-        border-radius: 10px;
-        padding: 10px 15px;
-        margin: 10px 0;
-        border-left: 3px solid #8b5cf6;
-    }}
-
-    .gradient-text {{
-        background: linear-gradient(90deg, #64FFDA, #8b5cf6);
-        -webkit-background-clip: text;
-        background-clip: text;
-        color: transparent;
-        font-weight: bold;
-    }}
-
-    @keyframes float {{
-        0%, 100% {{ transform: translateY(0px); }}
-        50% {{ transform: translateY(-8px); }}
-    }}
-    </style>
+        response = self.cache.get(user_input, context)
+        if response is not None:
+            # Keep the model's view of the conversation in sync with the transcript
+            self.chatbot.add_turn(user_input, response)
+        return response
+
+    def _remember(self, user_input, context, response):
+        """Cache and record a complete answer; stopped and failed ones never get here."""
+        if self.cache is not None:
+            self.cache.set(user_input, context, response)
+        self.chatbot.add_turn(user_input, response)
+
+    def _context(self) -> List[tuple]:
+        """The history the model will see, as (user, assistant) pairs for the cache key.
+
+        Includes the retrieval corpus version so answers grounded in old
+        portfolio content are not served after it changes.
+        """
+        memory = self.chatbot.memory
+        context = list(memory.turns)
+        if memory.summary:
+            context.insert(0, ("", memory.summary))
+        if RAG_ENABLED:
+            context.insert(0, ("corpus", corpus_version()))
+        return context
+
+class ModelChat:
+    """One visitor's conversation with the shared model provider."""
+
+    def __init__(self, provider: ChatProvider = None, memory: dict = None):
+        # Shared per process (CHATBOT_BACKEND); the session only owns its memory
+        self.provider = provider or get_provider()
+        # Bounded history: recent turns verbatim plus a summary of older ones,
+        # restored from ``memory`` (a ConversationMemory snapshot) if given
+        self.memory = ConversationMemory()
+        if memory:
+            self.memory.restore(memory)
+
+    def get_response(self, user_input, cancel=None):
+        """Full reply, with deadline and retries; runs on the worker pool.
+
+        Raises RequestCancelled when ``cancel`` is set and the last error if
+        every attempt failed.
+        """
+        # Each attempt starts from the memory so a retry never sees a half-recorded turn
+        history = self.memory.history()
+        return call_with_retry(lambda: self.provider.send(history, user_input, TIMEOUT), cancel=cancel)
+
+    def stream_response(self, user_input, cancel=None):
+        """Chunks of the reply as the model generates them; raises like get_response."""
+        history = self.memory.history()
+        return stream_with_retry(lambda: self.provider.stream(history, user_input, TIMEOUT), cancel=cancel)
+
+    def add_turn(self, user_input, response):
+        """Record a completed turn in the conversation memory."""
+        self.memory.add(user_input, response)
+
+    @staticmethod
+    def format_error(e):
+        # Enhanced error handling
+        error_msg = f"⚠️ AI Service Error: {str(e)}"
+        if "404" in str(e):
+            error_msg += "\n\nPlease check:\n1. Model availability\n2. API endpoint configuration\n3. Account permissions"
+        return error_msg
+
+# --- Waiting for a full reply ---
+def wait_for_answer(fn, status, cancel):
+    """Run ``fn()`` on its own thread, ticking ``status`` about once a second.
+
+    Streamlit can only stop a script at one of its own calls, so the ticks
+    are what let a rerun (the Stop button) interrupt a long wait; the request
+    itself is abandoned through ``cancel``.
     """
+    result = {}
+    waiter = threading.Thread(target=lambda: result.update(answer=fn()), name="chat-wait", daemon=True)
+    waiter.start()
+    started = time.monotonic()
+    try:
+        while waiter.is_alive():
+            waiter.join(timeout=1)
+            if waiter.is_alive():
+                status.caption(f"Waiting for the model… {time.monotonic() - started:.0f}s")
+    except BaseException:
+        cancel.cancel()
+        raise
+    status.empty()
+    return result["answer"]
+
+# --- Rate limiting ---
+def allow_message():
+    """Spend one message from the session and global budgets, warning if exhausted."""
+    allowed, retry_after = rate_limiter.check(st.session_state.session_id)
+    if not allowed:
+        st.warning(f"You're sending messages too quickly. Please try again in {retry_after:.0f} seconds.")
+    return allowed
 
 # --- Main Application ---
+@perf.profiled("chatbot")
 def main():
+    warmup.start()
     # Load images
-    bg_image = img_to_base64(assets_dir / "bg4.jpg")
-    profile_image = img_to_base64(assets_dir / "hafsa.png")
+    with perf.phase("images"):
+        bg_image, profile_image = page_images("chatbot", st.error)
     
     # Apply custom CSS
     st.set_page_config(page_title="AI Assistant", page_icon="🤖", layout="wide")
-    st.markdown(get_custom_css(bg_image, profile_image), unsafe_allow_html=True)
-
-    # Initialize session state
-    if "assistant" not in st.session_state:
-        st.session_state.assistant = AIAssistant()
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
-
-    # Sidebar with profile
-    with st.sidebar:
-        if profile_image:
-            st.markdown(f"""
-            <div style="display: flex; justify-content: center; margin-bottom: 20px;">
-                <img src="data:image/png;base64,{profile_image}" class="profile-img">
-            </div>
-            """, unsafe_allow_html=True)
-        else:
+    reduced_motion = motion_toggle(st.session_state, st.sidebar)
+    with perf.phase("styles"):
+        st.markdown(style_tag("chatbot", bg_image, reduced_motion), unsafe_allow_html=True)
+
+    # Each visitor's chat lives in the session registry (core/sessions.py),
+    # which brings it back from disk if it was moved out of memory while the
+    # visitor was away; session state only keeps the key.
+    if "session_id" not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex
+    with get_session_registry().chat(st.session_state.session_id) as chat:
+        chat.setdefault("messages", [])
+        if "assistant" not in chat:
+            chat["assistant"] = AIAssistant(memory=chat.pop("memory", None))
+
+        # A rerun while an answer was still streaming means the visitor pressed
+        # Stop (or interacted with the page): cancel it and keep what arrived.
+        in_flight = st.session_state.pop("in_flight", None)
+        if in_flight:
+            in_flight["cancel"].cancel()
+            partial = in_flight["partial"].strip()
+            chat["messages"].append(
+                new_message("assistant", f"{partial}\n\n_(stopped)_" if partial else "_(stopped)_")
+            )
+
+        # Sidebar with profile
+        with st.sidebar:
+            if profile_image:
+                st.markdown(f"""
+                <div style="display: flex; justify-content: center; margin-bottom: 20px;">
+                    {profile_image}
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div style="width:150px; height:150px; border-radius:50%; background:#112240; 
+                            margin: 0 auto 20px auto; display:flex; align-items:center; 
+                            justify-content:center; border:3px solid #64FFDA; color:#64FFDA;">
+                    AI
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown("## <span class='gradient-text' > Hafsa Kamali AI Assistant</span>", unsafe_allow_html=True)
             st.markdown("""
-            <div style="width:150px; height:150px; border-radius:50%; background:#112240; 
-                        margin: 0 auto 20px auto; display:flex; align-items:center; 
-                        justify-content:center; border:3px solid #64FFDA; color:#64FFDA;">
-                AI
+            <div style="margin-top: 20px;">
+                <p>Ask me about:</p>
+                <ul>
+                    <li>Technology</li>
+                    <li>Machine Learning</li>
+                    <li>Web Development</li>
+                    <li>Data Science</li>
+                </ul>
             </div>
             """, unsafe_allow_html=True)
+        
+            st.markdown("---")
+            provider = chat["assistant"].chatbot.provider
+            st.markdown(f"**Model: {provider.model_name}**")
+            st.markdown(f"**Provider: {provider.label}**")
 
-        st.markdown("## <span class='gradient-text' > Hafsa Kamali AI Assistant</span>", unsafe_allow_html=True)
+        # Main Area
+        st.markdown("# <span class='gradient-text'>Personal AI Assistant</span>", unsafe_allow_html=True)
+    
         st.markdown("""
-        <div style="margin-top: 20px;">
-            <p>Ask me about:</p>
-            <ul>
-                <li>Technology</li>
-                <li>Machine Learning</li>
-                <li>Web Development</li>
-                <li>Data Science</li>
-            </ul>
+        <div style="background-color: rgba(17, 34, 64, 0.7); border-radius: 15px; padding: 20px; margin-bottom: 20px; color: white;">
+        <h2 style="color: #64FFDA;">About the Founder: <span class='gradient-text'> Hafsa Kamali </span></h2>
+        <p>Hafsa Kamali is an innovative technologist and AI enthusiast passionate about bridging the gap between cutting-edge technology and practical applications. With a strong background in machine learning, web development, and data science, she has developed this intelligent AI assistant to make advanced technological solutions more accessible.</p>
+
+        <h3 style="color: #8b5cf6;">Professional Highlights</h3>
+        <ul style="list-style-type: none; padding-left: 0;">
+            <li>🚀 Expert in Machine Learning and Artificial Intelligence</li>
+            <li>💻 Certified Web Developer</li>
+            <li>📊 Data Science Practitioner</li>
+            <li>🌐 Technology Innovation Advocate</li>
+        </ul>
+
+        <p>Through this AI assistant, Hafsa aims to demonstrate the potential of conversational AI in providing intelligent, context-aware support across various technological domains.</p>
         </div>
         """, unsafe_allow_html=True)
-        
-        st.markdown("---")
-        st.markdown("**Model: Gemini Pro**")
-        st.markdown("**Provider: Google AI**")
 
-    # Main Area
-    st.markdown("# <span class='gradient-text'>Personal AI Assistant</span>", unsafe_allow_html=True)
-    
-    st.markdown("""
-    <div style="background-color: rgba(17, 34, 64, 0.7); border-radius: 15px; padding: 20px; margin-bottom: 20px; color: white;">
-    <h2 style="color: #64FFDA;">About the Founder: <span class='gradient-text'> Hafsa Kamali </span></h2>
-    <p>Hafsa Kamali is an innovative technologist and AI enthusiast passionate about bridging the gap between cutting-edge technology and practical applications. With a strong background in machine learning, web development, and data science, she has developed this intelligent AI assistant to make advanced technological solutions more accessible.</p>
-
-    <h3 style="color: #8b5cf6;">Professional Highlights</h3>
-    <ul style="list-style-type: none; padding-left: 0;">
-        <li>🚀 Expert in Machine Learning and Artificial Intelligence</li>
-        <li>💻 Certified Web Developer</li>
-        <li>📊 Data Science Practitioner</li>
-        <li>🌐 Technology Innovation Advocate</li>
-    </ul>
-
-    <p>Through this AI assistant, Hafsa aims to demonstrate the potential of conversational AI in providing intelligent, context-aware support across various technological domains.</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    chat_container = st.container()
-
-    with chat_container:
-        st.markdown('<div class="chat-container">', unsafe_allow_html=True)
-
-        for message in st.session_state.messages:
-            if message["role"] == "user":
-                st.markdown(f'<div class="user-message">👻<strong>You:</strong> {message["content"]}</div>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<div class="assistant-message">🐱‍👓<strong>Assistant:</strong> {message["content"]}</div>', unsafe_allow_html=True)
+        chat_container = st.container()
+
+        with chat_container:
+            st.markdown('<div class="chat-container">', unsafe_allow_html=True)
+
+            transcript = TranscriptRenderer(chat)
+            with perf.phase("transcript"):
+                transcript.render(chat["messages"])
+
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        user_input = st.chat_input("Type your message here...")
 
-        st.markdown('</div>', unsafe_allow_html=True)
+        if user_input and allow_message():
+            user_message = new_message("user", user_input)
+            chat["messages"].append(user_message)
+            with chat_container, perf.phase("chat call"):
+                transcript.render_new(user_message)
+                if STREAMING:
+                    st.markdown('<div class="assistant-message">🐱‍👓<strong>Assistant:</strong></div>', unsafe_allow_html=True)
+                # Pressing Stop reruns the page, which cancels the request (see above)
+                cancel = CancelToken()
+                in_flight = st.session_state.in_flight = {"cancel": cancel, "partial": ""}
+                stop_button = st.empty()
+                stop_button.button("⏹ Stop generating", key="stop_generating")
+                if STREAMING:
 
-    user_input = st.chat_input("Type your message here...")
+                    def track(stream):
+                        for chunk in stream:
+                            in_flight["partial"] += chunk
+                            yield chunk
 
-    if user_input:
-        st.session_state.messages.append({"role": "user", "content": user_input})
-        with st.spinner("Thinking..."):
-            ai_response = st.session_state.assistant.generate_response(user_input)
-            st.session_state.messages.append({"role": "assistant", "content": ai_response})
-        st.rerun()
+                    ai_response = st.write_stream(track(chat["assistant"].stream_response(user_input, cancel)))
+                else:
+                    with st.spinner("Thinking..."):
+                        ai_response = wait_for_answer(
+                            lambda: chat["assistant"].generate_response(user_input, cancel), st.empty(), cancel
+                        )
+                st.session_state.pop("in_flight", None)
+                stop_button.empty()
+            assistant_message = new_message("assistant", ai_response)
+            chat["messages"].append(assistant_message)
+            if not STREAMING:
+                with chat_container:
+                    transcript.render_new(assistant_message)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,57 @@
+import threading
+import time
+
+import pytest
+
+from core import worker
+from core.providers import LocalProvider
+from core.worker import CancelToken, PoolSaturated
+from pages.chatbot import AIAssistant
+
+
+def assistant(**kwargs):
+    kwargs.setdefault("latency", 0)
+    kwargs.setdefault("tokens_per_second", 0)
+    bot = AIAssistant(provider=LocalProvider(**kwargs))
+    bot.cache = None
+    return bot
+
+
+def test_full_reply_is_recorded():
+    bot = assistant()
+    response = bot.generate_response("Which projects has she built?")
+    assert response.startswith("Hafsa has built")
+    assert list(bot.chatbot.memory.turns) == [("Which projects has she built?", response)]
+
+
+def test_cancel_interrupts_a_full_reply():
+    bot = assistant(latency=5)
+    cancel = CancelToken()
+    threading.Timer(0.2, cancel.cancel).start()
+    started = time.monotonic()
+    assert bot.generate_response("a slow question nobody else asks", cancel) == ""
+    assert time.monotonic() - started < 2
+    assert not bot.chatbot.memory.turns
+
+
+def test_stream_stopped_midway_is_not_recorded():
+    bot = assistant(tokens_per_second=20)
+    cancel = CancelToken()
+    stream = bot.stream_response("tell me about her skills", cancel)
+    assert next(stream)
+    cancel.cancel()
+    assert list(stream) == []
+    assert not bot.chatbot.memory.turns
+
+
+def test_saturated_pool_fails_fast(monkeypatch):
+    monkeypatch.setattr(worker, "_slots", threading.BoundedSemaphore(1))
+    release = threading.Event()
+    busy = worker.submit(release.wait)
+    with pytest.raises(PoolSaturated):
+        worker.submit(lambda: None)
+    with pytest.raises(PoolSaturated):
+        worker.call_with_retry(lambda: None, timeout=1, retries=0)
+    release.set()
+    busy.result(timeout=1)
+    assert worker.call_with_retry(lambda: "ok", timeout=1) == "ok"
@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+
+from core.ratelimit import RateLimiter, SingleFlight, TokenBucket
+from core.worker import CancelToken, RequestCancelled
+
+
+class Upstream:
+    """A stream that hands out one chunk each time ``step`` is called."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.steps = threading.Semaphore(0)
+        self.calls = 0
+        self.cancel = None
+
+    def step(self, n=1):
+        for _ in range(n):
+            self.steps.release()
+
+    def __call__(self, cancel):
+        self.calls += 1
+        self.cancel = cancel
+        for chunk in self.chunks:
+            while not self.steps.acquire(timeout=0.05):
+                if cancel.cancelled:
+                    raise RequestCancelled()
+            yield chunk
+
+
+def test_first_caller_stopping_does_not_truncate_followers():
+    flights = SingleFlight()
+    upstream = Upstream(["a", "b", "c"])
+    leader_cancel = CancelToken()
+    leader = flights.stream("key", upstream, leader_cancel)
+    follower = flights.stream("key", upstream)
+
+    upstream.step()
+    assert next(leader) == "a"
+    assert next(follower) == "a"
+    leader_cancel.cancel()
+    with pytest.raises(RequestCancelled):
+        next(leader)
+
+    upstream.step(2)
+    assert list(follower) == ["b", "c"]
+    assert upstream.calls == 1
+    assert flights.coalesced == 1
+    assert not upstream.cancel.cancelled
+
+
+def test_upstream_is_cancelled_once_everyone_left():
+    flights = SingleFlight()
+    upstream = Upstream(["a", "b"])
+    first, second = CancelToken(), CancelToken()
+    streams = [flights.stream("key", upstream, first), flights.stream("key", upstream, second)]
+    upstream.step()
+    for stream in streams:
+        assert next(stream) == "a"
+
+    first.cancel()
+    with pytest.raises(RequestCancelled):
+        next(streams[0])
+    assert not upstream.cancel.cancelled
+    second.cancel()
+    with pytest.raises(RequestCancelled):
+        next(streams[1])
+    assert upstream.cancel.cancelled
+
+    # A later identical question starts a fresh request
+    fresh = Upstream(["x"])
+    fresh.step()
+    assert list(flights.stream("key", fresh)) == ["x"]
+
+
+def test_upstream_error_is_raised_to_the_caller():
+    flights = SingleFlight()
+
+    def fail(cancel):
+        raise RuntimeError("503 unavailable")
+
+    with pytest.raises(RuntimeError):
+        flights.do("key", fail)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_allows_a_burst_then_refills_at_its_rate():
+    clock = Clock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+    assert bucket.retry_after() == pytest.approx(0.5)
+    clock.now = 0.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_bucket_never_holds_more_than_its_capacity():
+    clock = Clock()
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock)
+    clock.now = 100
+    assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+    bucket.refund(5)
+    assert bucket.tokens == 2
+
+
+def test_limiter_limits_each_session_separately():
+    clock = Clock()
+    limiter = RateLimiter(session_rate=60, session_burst=2, global_rate=600, global_burst=100, clock=clock)
+    assert [limiter.check("a")[0] for _ in range(3)] == [True, True, False]
+    assert limiter.check("b") == (True, 0.0)
+    allowed, retry_after = limiter.check("a")
+    assert not allowed and retry_after == pytest.approx(1.0)
+    assert limiter.rejected == 2
+    clock.now = 1
+    assert limiter.check("a") == (True, 0.0)
+
+
+def test_global_limit_rejects_without_spending_the_session_budget():
+    clock = Clock()
+    limiter = RateLimiter(session_rate=1, session_burst=2, global_rate=60, global_burst=2, clock=clock)
+    assert limiter.check("a")[0] and limiter.check("b")[0]
+    allowed, retry_after = limiter.check("c")
+    assert not allowed and retry_after == pytest.approx(1.0)
+    # "c" was refunded (its own bucket barely refills), so it still has its burst
+    clock.now = 2
+    assert limiter.check("c")[0] and limiter.check("c")[0]
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import pytest
+
+from core.resolver import image_size
+
+ASSETS = Path(__file__).parent.parent / "assets"
+IMAGES = sorted(p for p in ASSETS.iterdir() if p.suffix.lower() in (".png", ".jpg", ".jpeg"))
+
+
+@pytest.mark.parametrize("path", IMAGES, ids=lambda p: p.name)
+def test_size_matches_the_image(path):
+    # Pillow is optional (see core/optimize.py)
+    Image = pytest.importorskip("PIL.Image")
+    with Image.open(path) as image:
+        assert image_size(path) == image.size
+
+
+# Cut inside the PNG header, or before the JPEG's start-of-frame segment
+@pytest.mark.parametrize("name, keep", [("hafsa.png", 4), ("hafsa.png", 20), ("bg1.jpg", 4), ("bg1.jpg", 200)])
+def test_truncated_image_has_no_size(tmp_path, name, keep):
+    truncated = tmp_path / name
+    truncated.write_bytes((ASSETS / name).read_bytes()[:keep])
+    assert image_size(truncated) == (None, None)
+
+
+def test_zero_length_jpeg_segment_has_no_size(tmp_path):
+    corrupt = tmp_path / "corrupt.jpg"
+    corrupt.write_bytes(b"\xff\xd8\xff\xe0\x00\x00" + b"\x00" * 32)
+    assert image_size(corrupt) == (None, None)
+
+
+def test_other_files_have_no_size(tmp_path):
+    text = tmp_path / "notes.png"
+    text.write_text("not an image")
+    assert image_size(text) == (None, None)
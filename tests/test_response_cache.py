@@ -0,0 +1,12 @@
+from core.response_cache import cache_key, normalize
+
+
+def test_punctuation_and_spacing_do_not_change_the_key():
+    assert normalize("  What projects has   she built?! ") == "what projects has she built"
+    assert cache_key("What projects has she built?") == cache_key("what projects has she built")
+
+
+def test_language_names_keep_their_symbols():
+    keys = {cache_key(q) for q in ("Does she know C++?", "Does she know C#?", "Does she know C?")}
+    assert len(keys) == 3
+    assert normalize("Has she used Node.js.") == "has she used node.js"
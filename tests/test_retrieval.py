@@ -0,0 +1,42 @@
+from core.retrieval import BM25Index, Document, tokenize
+
+DOCS = [
+    Document("radar", "Expertise", "Machine learning, data science and web development."),
+    Document("ml", "Machine learning", "Machine learning models trained with machine learning tools."),
+    Document("web", "Web projects", "Frontend projects built with Next.js and TypeScript."),
+    Document("cpp", "Languages", "Writes C++ and C# as well as Python."),
+]
+
+
+def ids(results):
+    return [doc.id for doc in results]
+
+
+def test_more_occurrences_rank_higher():
+    assert ids(BM25Index(DOCS).search("machine learning")) == ["ml", "radar"]
+
+
+def test_rare_term_outranks_common_one():
+    # "web" appears in two documents, "typescript" only in one
+    assert ids(BM25Index(DOCS).search("web typescript"))[0] == "web"
+
+
+def test_shorter_document_wins_a_tie_on_term_frequency():
+    docs = [
+        Document("long", "Notes", "python " + " ".join(f"filler{i}" for i in range(30))),
+        Document("short", "Notes", "python scripts"),
+        Document("other", "Notes", "nothing relevant"),
+    ]
+    assert ids(BM25Index(docs).search("python")) == ["short", "long"]
+
+
+def test_k_limits_results_and_unknown_terms_match_nothing():
+    index = BM25Index(DOCS)
+    assert len(index.search("machine learning web", k=1)) == 1
+    assert index.search("quantum") == []
+    assert index.search("what is the") == []
+
+
+def test_language_names_are_distinct_terms():
+    assert tokenize("C++, C# and C") == ["c++", "c#", "c"]
+    assert ids(BM25Index(DOCS).search("C#")) == ["cpp"]
@@ -0,0 +1,89 @@
+from core.sessions import JSONLStore, SessionRegistry
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def registry(tmp_path, alive=lambda runtime_id: True, **kwargs):
+    clock = Clock()
+    kwargs.setdefault("ttl", 1000)
+    kwargs.setdefault("min_idle", 10)
+    return SessionRegistry(JSONLStore(tmp_path), clock=clock, alive=alive, **kwargs), clock
+
+
+def run(sessions, key, runtime_id=None, text="hello"):
+    chat = sessions.open(key, runtime_id)
+    chat.setdefault("messages", []).append({"role": "user", "content": text})
+    sessions.release(key)
+    return chat
+
+
+def test_closed_session_is_dropped_not_spilled(tmp_path):
+    live = {"r1", "r2"}
+    sessions, _ = registry(tmp_path, alive=lambda runtime_id: runtime_id in live)
+    run(sessions, "a", "r1")
+    live.discard("r1")
+    run(sessions, "b", "r2")
+    assert sessions.stats()["resident"] == 1
+    assert sessions.closed == 1
+    assert "a" not in sessions._entries
+    assert sessions.store.pop("a") is None
+
+
+def test_spilled_chat_is_deleted_when_its_session_closes(tmp_path):
+    live = {"r1", "r2"}
+    sessions, clock = registry(tmp_path, alive=lambda runtime_id: runtime_id in live, ttl=30)
+    run(sessions, "a", "r1")
+    clock.now = 60
+    run(sessions, "b", "r2")
+    assert sessions.expired == 1
+    assert list(tmp_path.glob("*.jsonl")) == [tmp_path / "a.jsonl"]
+
+    live.discard("r1")
+    run(sessions, "b", "r2")
+    assert sessions.pruned == 1
+    assert list(tmp_path.glob("*.jsonl")) == []
+    assert "messages" not in sessions.open("a")
+
+
+def test_budget_evicts_least_recently_seen_idle_chat(tmp_path):
+    sessions, clock = registry(tmp_path, budget_bytes=1000)
+    run(sessions, "old", text="x" * 400)
+    clock.now = 5
+    run(sessions, "new", text="y" * 400)
+    # "old" is over budget but has not been idle for min_idle yet
+    assert sessions.evicted_for_budget == 0
+    clock.now = 12
+    run(sessions, "third", text="z")
+    assert sessions.evicted_for_budget == 1
+    assert set(sessions._entries) == {"new", "third"}
+
+
+def test_running_chat_is_never_evicted(tmp_path):
+    sessions, clock = registry(tmp_path, budget_bytes=0, ttl=1)
+    chat = sessions.open("busy")
+    chat["messages"] = [{"role": "user", "content": "still streaming"}]
+    clock.now = 50
+    run(sessions, "other")
+    assert sessions._entries["busy"].chat is chat
+    sessions.release("busy")
+    assert "busy" in sessions._entries
+
+
+def test_evicted_chat_is_rehydrated(tmp_path):
+    sessions, clock = registry(tmp_path, ttl=30)
+    run(sessions, "a", text="first")
+    clock.now = 60
+    run(sessions, "b")
+    assert sessions.expired == 1
+
+    chat = sessions.open("a")
+    assert [m["content"] for m in chat["messages"]] == ["first"]
+    assert chat["memory"] == {}
+    assert sessions.rehydrated == 1
+    sessions.release("a")
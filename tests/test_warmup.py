@@ -0,0 +1,28 @@
+import threading
+import time
+
+from core import warmup
+
+
+def test_stuck_step_only_delays_pages_until_the_deadline(monkeypatch):
+    release = threading.Event()
+    steps = (("stuck", release.wait),)
+    monkeypatch.setattr(warmup, "WARMUP_ENABLED", True)
+    monkeypatch.setattr(warmup, "STEPS", steps)
+    monkeypatch.setattr(warmup, "SHARED_STEPS", steps)
+    monkeypatch.setattr(warmup, "_state", {"thread": None, "results": [], "finished_at": None, "deadline": None})
+    monkeypatch.setattr(warmup, "_shared_ready", threading.Event())
+
+    started = time.monotonic()
+    assert warmup.start(timeout=0.2)
+    assert 0.15 < time.monotonic() - started < 1
+    # Later runs do not wait again
+    started = time.monotonic()
+    warmup.start(timeout=0.2)
+    assert time.monotonic() - started < 0.1
+    assert not warmup.is_ready()
+
+    release.set()
+    warmup._state["thread"].join(timeout=1)
+    assert warmup.is_ready()
+    assert [r.name for r in warmup.report()] == ["stuck"]